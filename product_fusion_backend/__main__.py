@@ -1,9 +1,47 @@
-from product_fusion_backend.web.application import get_app
-from product_fusion_backend.web.hypercorn_app import HypercornApplication
+import argparse
+import asyncio
+
+
+async def rebuild_counters() -> None:
+    """Reconcile the membership counters and daily snapshots with the member table."""
+    from product_fusion_backend.connections import database
+    from product_fusion_backend.core import logger
+    from product_fusion_backend.dao import MemberCounterDAO, MemberSnapshotDAO
+
+    try:
+        rows = await MemberCounterDAO().rebuild()  # type: ignore
+        logger.info(f"Rebuilt {rows} membership counters")
+        rows = await MemberSnapshotDAO().rebuild()  # type: ignore
+        logger.info(f"Rebuilt {rows} daily member snapshots")
+    finally:
+        await database.dispose()
 
 
 def main() -> None:
     """Entrypoint of the application."""
+    parser = argparse.ArgumentParser(prog="product_fusion_backend")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="api",
+        choices=["api", "worker", "rebuild-counters"],
+        help="process to start: the HTTP API (default), the email worker, or a one-off membership counter rebuild",
+    )
+    args = parser.parse_args()
+
+    if args.command == "rebuild-counters":
+        asyncio.run(rebuild_counters())
+        return
+
+    if args.command == "worker":
+        from product_fusion_backend.worker import EmailWorker
+
+        EmailWorker().run()
+        return
+
+    from product_fusion_backend.web.application import get_app
+    from product_fusion_backend.web.hypercorn_app import HypercornApplication
+
     app = get_app()
     hypercorn_app = HypercornApplication(app)
     hypercorn_app.run()
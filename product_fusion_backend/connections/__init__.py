@@ -1,27 +1,135 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from functools import wraps
-from typing import Any, AsyncGenerator, Awaitable, Callable, TypeVar, cast
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Optional, TypeVar, cast, overload
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import ORMExecuteState
 
+from product_fusion_backend.connections.pool import InstrumentedAsyncPool
+from product_fusion_backend.connections.replicas import REPLICA_FAILURES, Replica, ReplicaSet
 from product_fusion_backend.settings import settings
 
 F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+R = TypeVar("R")
+
+
+class UnitOfWork:
+    """
+    Request-scoped unit of work.
+
+    The session is opened lazily on first use, shared by every DAO call made
+    while the unit of work is active and committed exactly once by its owner.
+    Once it has written anything, ``has_writes`` keeps read-only calls on the
+    primary so they see those writes. Once rolled back, ``rolled_back`` keeps
+    its owner from committing anything done afterwards.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+        self._session: Optional[AsyncSession] = None
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
+        self.has_writes = False
+        self.rolled_back = False
+
+    def get_session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+            event.listen(self._session.sync_session, "do_orm_execute", self._track_writes)
+            event.listen(self._session.sync_session, "after_flush", self._mark_written)
+        return self._session
+
+    def _track_writes(self, orm_execute_state: ORMExecuteState) -> None:
+        if not orm_execute_state.is_select:
+            self.has_writes = True
+
+    def _mark_written(self, *_: Any) -> None:
+        self.has_writes = True
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        if self._session is not None:
+            await self._session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            # The transaction is already committed: a failing callback must not
+            # turn it into an error response or skip the callbacks after it.
+            try:
+                await callback()
+            except Exception as exception:
+                logger.error(f"After-commit callback failed: {exception!r}")
+
+    async def rollback(self) -> None:
+        self.rolled_back = True
+        self._after_commit = []
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+_current_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar("current_unit_of_work", default=None)
+
+
+class ReadOnlySessionError(RuntimeError):
+    """Raised when a write is attempted on a read replica session."""
+
+
+def _reject_write(orm_execute_state: ORMExecuteState) -> None:
+    if not orm_execute_state.is_select:
+        raise ReadOnlySessionError("Write statement executed on a read replica session")
+
+
+def _reject_flush(*_: Any) -> None:
+    raise ReadOnlySessionError("Flush attempted on a read replica session")
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    connect_args: dict[str, Any] = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args["statement_cache_size"] = settings.database_statement_cache_size
+
+    return create_async_engine(
+        url,
+        echo=settings.database_echo,
+        future=True,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        connect_args=connect_args,
+    )
+
+
+def _create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=engine,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+        class_=AsyncSession,
+    )
 
 
 class Database:
     def __init__(self) -> None:
-        self.engine = create_async_engine(
-            settings.database_url,
-            echo=settings.reload,
-            future=True,
-        )
-        self.session_factory = async_sessionmaker(
-            bind=self.engine,
-            expire_on_commit=False,
-            autocommit=False,
-            autoflush=False,
-            class_=AsyncSession,
-        )
+        self.engine = _create_engine(settings.database_url)
+        self.session_factory = _create_session_factory(self.engine)
+        replicas = []
+        for url in settings.database_replica_urls:
+            engine = _create_engine(url)
+            replicas.append(Replica(engine, _create_session_factory(engine)))
+        self.replicas = ReplicaSet(replicas, settings.database_replica_retry_seconds)
 
     async def get_db(self) -> AsyncGenerator[AsyncSession, None]:
         async with self.session_factory() as session:
@@ -32,20 +140,156 @@ class Database:
                 await session.rollback()
                 raise
 
+    def pool_stats(self) -> dict[str, Any]:
+        return cast(InstrumentedAsyncPool, self.engine.pool).stats()
+
+    def replica_stats(self) -> list[dict[str, Any]]:
+        return self.replicas.stats()
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
+        await self.replicas.dispose()
+
+    async def run_read_only(self, func: Callable[[AsyncSession], Awaitable[R]]) -> R:
+        """
+        Run a read against a replica when it is safe to.
+
+        The primary is used when no replica is configured or healthy, when the
+        active unit of work has already written (read-your-writes), and as a
+        fallback when the chosen replica fails, which also ejects it. The
+        fallback joins the active unit of work, so inside a request it runs in
+        the request's transaction like any other call.
+
+        Replica sessions are never committed, so any write attempted on one
+        raises instead of being silently discarded.
+
+        :param func: read to run with the session it is given.
+        :return: result of ``func``.
+        """
+        uow = _current_unit_of_work.get()
+        replica = None if uow is not None and uow.has_writes else self.replicas.choose()
+        if replica is not None:
+            try:
+                async with replica.session_factory() as session:
+                    event.listen(session.sync_session, "do_orm_execute", _reject_write)
+                    event.listen(session.sync_session, "before_flush", _reject_flush)
+                    return await func(session)
+            except REPLICA_FAILURES as exception:
+                self.replicas.eject(replica, exception)
+
+        async with self.unit_of_work() as primary:
+            return await func(primary.get_session())
+
+    @staticmethod
+    def current_unit_of_work() -> Optional[UnitOfWork]:
+        return _current_unit_of_work.get()
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[UnitOfWork]:
+        """
+        Share one session across every DAO call made inside the block.
+
+        The session is committed when the block exits cleanly, unless it was
+        already rolled back inside the block, and rolled back when it raises.
+        Entering while another unit of work is active joins the outer one,
+        which stays responsible for the commit.
+
+        :yields: active unit of work.
+        """
+        outer = _current_unit_of_work.get()
+        if outer is not None:
+            yield outer
+            return
+
+        uow = UnitOfWork(self.session_factory)
+        token = _current_unit_of_work.set(uow)
+        try:
+            yield uow
+            if not uow.rolled_back:
+                await uow.commit()
+        except Exception:
+            await uow.rollback()
+            raise
+        finally:
+            _current_unit_of_work.reset(token)
+            await uow.close()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Borrow a session for reads that outlive a single awaited call.
+
+        Async generators can't be wrapped by ``inject_session``, so streaming
+        reads use this instead. The session always has a connection of its
+        own, never the active unit of work's: a server-side cursor keeps its
+        connection busy until it is exhausted, and any DAO call awaited while
+        iterating would otherwise fail on that same connection. It does not
+        see writes the unit of work has not committed yet.
+
+        :yields: session to read from, closed when the block exits.
+        """
+        async with self.session_factory() as session:
+            yield session
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[AsyncSession]:
+        """
+        Run a block in an explicit nested transaction.
+
+        Inside a unit of work the block gets a SAVEPOINT on the shared session,
+        so a failure only undoes the block's own writes. Outside of one it gets
+        a standalone unit of work.
+
+        :yields: session bound to the nested transaction.
+        """
+        uow = _current_unit_of_work.get()
+        if uow is None:
+            async with self.unit_of_work() as standalone:
+                yield standalone.get_session()
+            return
+
+        session = uow.get_session()
+        async with session.begin_nested():
+            yield session
+
 
 database = Database()
 
 
-def inject_session(func: F) -> F:
-    @wraps(func)
-    async def wrapper(*args: Any, **kwargs: Any) -> Any:
-        async for session in database.get_db():
+@overload
+def inject_session(func: F) -> F: ...
+
+
+@overload
+def inject_session(*, read_only: bool = False) -> Callable[[F], F]: ...
+
+
+def inject_session(func: Optional[F] = None, *, read_only: bool = False) -> Any:
+    """
+    Pass the DAO method the session of the active unit of work.
+
+    Only methods declared with ``read_only=True`` may be served by a read
+    replica instead, so they must not write.
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
             if "session" in kwargs:
                 raise ValueError("Session argument already provided")
-            kwargs["session"] = session
-            return await func(*args, **kwargs)
 
-    return cast(F, wrapper)
+            if read_only:
+                return await database.run_read_only(lambda session: func(*args, session=session, **kwargs))
+
+            async with database.unit_of_work() as uow:
+                kwargs["session"] = uow.get_session()
+                return await func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    if func is None:
+        return decorator
+    return decorator(func)
 
 
-__all__ = ["database", "inject_session"]
+__all__ = ["database", "inject_session", "ReadOnlySessionError", "UnitOfWork"]
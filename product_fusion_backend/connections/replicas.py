@@ -0,0 +1,74 @@
+import time
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+# Failures that mean the replica itself is unusable rather than the query
+# being wrong, so the read is retried on the primary.
+REPLICA_FAILURES = (OperationalError, InterfaceError, PoolTimeoutError, OSError)
+
+
+class Replica:
+    def __init__(self, engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self.engine = engine
+        self.session_factory = session_factory
+        self.ejected_until = 0.0
+        self.reads = 0
+        self.failures = 0
+
+    @property
+    def name(self) -> str:
+        return make_url(str(self.engine.url)).render_as_string(hide_password=True)
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.ejected_until
+
+
+class ReplicaSet:
+    """
+    Round-robin over read replicas, skipping the ones recently ejected.
+
+    A replica that fails a read is ejected for ``retry_seconds`` and put back
+    in rotation once that has elapsed.
+    """
+
+    def __init__(self, replicas: list[Replica], retry_seconds: float) -> None:
+        self.replicas = replicas
+        self.retry_seconds = retry_seconds
+        self._next = 0
+
+    def choose(self) -> Optional[Replica]:
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next]
+            self._next = (self._next + 1) % len(self.replicas)
+            if replica.healthy:
+                replica.reads += 1
+                return replica
+        return None
+
+    def eject(self, replica: Replica, exception: BaseException) -> None:
+        replica.failures += 1
+        replica.ejected_until = time.monotonic() + self.retry_seconds
+        logger.warning(
+            f"Ejecting read replica {replica.name} for {self.retry_seconds}s: {exception!r}",
+        )
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "replica": replica.name,
+                "healthy": replica.healthy,
+                "reads": replica.reads,
+                "failures": replica.failures,
+            }
+            for replica in self.replicas
+        ]
@@ -1,3 +1,4 @@
+from product_fusion_backend.core.cache import cached, dao_cache, stats_cache
 from product_fusion_backend.core.schema.common_response_schema import APIResponse, CommonResponseSchema
 from product_fusion_backend.core.services.email_service import email_service
 from product_fusion_backend.core.services.redis_service import redis_service
@@ -11,14 +12,18 @@ from product_fusion_backend.core.utils.constants import (
     VERIFY_EMAIL_TEMPLATE,
     VERIFY_EMAIL_WITH_PASS_RESET_TEMPLATE,
 )
-from product_fusion_backend.core.utils.enums import StatusEnum
-from product_fusion_backend.core.utils.hash_utils import HashManager
+from product_fusion_backend.core.utils.email_templates import EmailTemplate, email_templates
+from product_fusion_backend.core.utils.enums import ROLE_PERMISSIONS, Permission, StatusEnum
+from product_fusion_backend.core.utils.hash_utils import HashManager, HashPoolSaturatedError
 from product_fusion_backend.core.utils.logging import configure_logging, end_stage_logger, logger, stage_logger
 from product_fusion_backend.core.utils.open_telemetry_config import OpenTelemetry
+from product_fusion_backend.core.utils.permissions import PermissionTable, permission_table
 
 __all__ = [
     # Constants
     "StatusEnum",
+    "Permission",
+    "ROLE_PERMISSIONS",
     "DEFAULT_ROUTE_OPTIONS",
     "SKIP_URLS",
     # Common Schemas
@@ -33,10 +38,20 @@ __all__ = [
     "OpenTelemetry",
     # Utils
     "HashManager",
+    "HashPoolSaturatedError",
     # Services
     "email_service",
     "redis_service",
+    # Cache
+    "cached",
+    "dao_cache",
+    "stats_cache",
+    # Authorization
+    "PermissionTable",
+    "permission_table",
     # Templates
+    "EmailTemplate",
+    "email_templates",
     "PASSWORD_RESET_MAIL_TEMPLATE",
     "INVITE_MEMBER_MAIL_TEMPLATE",
     "VERIFY_EMAIL_TEMPLATE",
@@ -0,0 +1,13 @@
+from product_fusion_backend.core.cache.dao_cache import DAOCache, cached, dao_cache
+from product_fusion_backend.core.cache.local_cache import LocalCache
+from product_fusion_backend.core.cache.result_cache import CachedResult, ResultCache, stats_cache
+
+__all__ = [
+    "CachedResult",
+    "DAOCache",
+    "LocalCache",
+    "ResultCache",
+    "cached",
+    "dao_cache",
+    "stats_cache",
+]
@@ -0,0 +1,255 @@
+import asyncio
+import inspect
+import json
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar, cast
+
+from loguru import logger
+from redis.exceptions import RedisError
+
+from product_fusion_backend.connections import database
+from product_fusion_backend.core.cache.local_cache import LocalCache
+from product_fusion_backend.core.cache.serializer import dump_model, load_model
+from product_fusion_backend.core.services.redis_service import redis_service
+from product_fusion_backend.settings import settings
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# How long the Redis tier is skipped after a failure, so an outage costs one
+# timeout every few seconds instead of one per lookup.
+REDIS_RETRY_SECONDS = 5.0
+
+
+class DAOCache:
+    """
+    Two-tier cache for DAO point lookups.
+
+    Reads go to the per-process LRU first, then to Redis, and only then to
+    the database. Writes through the DAOs invalidate both tiers and broadcast
+    the invalidated keys so the other workers drop their local copies. Redis
+    failures degrade the cache to local-only instead of failing the request.
+    """
+
+    def __init__(self, enabled: bool, local_size: int, local_ttl: float, redis_ttl: int, channel: str) -> None:
+        self.enabled = enabled
+        self.local = LocalCache(local_size, local_ttl)
+        self.redis_ttl = redis_ttl
+        self.channel = channel
+        self.redis_hits = 0
+        self.redis_misses = 0
+        self.redis_errors = 0
+        self.invalidations = 0
+        self._redis_down_until = 0.0
+        self.listener_task: Optional[asyncio.Task[None]] = None
+        self._invalidation_listeners: list[Callable[[list[str]], None]] = []
+        self._pending_invalidations: dict[str, None] = {}
+
+    @staticmethod
+    def _redis_key(key: str) -> str:
+        return f"cache:{key}"
+
+    def _redis_available(self) -> bool:
+        return time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, action: str, exception: RedisError) -> None:
+        self.redis_errors += 1
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(f"Cache {action} in Redis failed: {exception}")
+
+    async def get(self, key: str) -> Optional[str]:
+        value = self.local.get(key)
+        if value is not None or not self._redis_available():
+            return value
+        if self._pending_invalidations:
+            await self._flush_invalidations()
+            if not self._redis_available():
+                return None
+
+        try:
+            redis_client = await redis_service.connect()
+            value = await redis_client.get(self._redis_key(key))
+        except RedisError as exception:
+            self._redis_failed("read", exception)
+            return None
+
+        if value is None:
+            self.redis_misses += 1
+            return None
+        self.redis_hits += 1
+        self.local.set(key, value)
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        self.local.set(key, value)
+        if not self._redis_available():
+            return
+        try:
+            redis_client = await redis_service.connect()
+            await redis_client.set(self._redis_key(key), value, ex=ttl or self.redis_ttl)
+        except RedisError as exception:
+            self._redis_failed("write", exception)
+
+    def add_invalidation_listener(self, listener: Callable[[list[str]], None]) -> None:
+        """
+        Call ``listener`` with every batch of invalidated keys, local or broadcast.
+
+        Invalidations are delivered even when the cache itself is disabled, so
+        in-process tables derived from rows can follow the same key scheme.
+
+        :param listener: synchronous callback taking the invalidated keys.
+        """
+        self._invalidation_listeners.append(listener)
+
+    def _notify(self, keys: list[str]) -> None:
+        for listener in self._invalidation_listeners:
+            listener(keys)
+
+    async def invalidate(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if keys:
+            self._notify(keys)
+        if not self.enabled or not keys:
+            return
+        self.invalidations += len(keys)
+        self.local.delete(*keys)
+        # While Redis is marked down the keys are kept and deleted once it is
+        # reachable again, so entries written before the outage are not
+        # served afterwards.
+        self._pending_invalidations.update(dict.fromkeys(keys))
+        await self._flush_invalidations()
+
+    async def _flush_invalidations(self) -> None:
+        if not self._redis_available():
+            self._trim_pending_invalidations()
+            return
+        keys = list(self._pending_invalidations)
+        try:
+            redis_client = await redis_service.connect()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.delete(*[self._redis_key(key) for key in keys])
+                pipe.publish(self.channel, json.dumps(keys))
+                await pipe.execute()
+        except RedisError as exception:
+            self._redis_failed("invalidation", exception)
+            self._trim_pending_invalidations()
+            return
+        for key in keys:
+            self._pending_invalidations.pop(key, None)
+
+    def _trim_pending_invalidations(self) -> None:
+        # Beyond this many keys the Redis TTL bounds how long they stay stale.
+        while len(self._pending_invalidations) > self.local.max_size:
+            del self._pending_invalidations[next(iter(self._pending_invalidations))]
+
+    async def invalidate_after_commit(self, keys: Iterable[str]) -> None:
+        """
+        Invalidate now and again once the active unit of work commits.
+
+        The second pass drops entries that concurrent requests re-populated
+        from the not yet committed state.
+
+        :param keys: cache keys of the written rows.
+        """
+        keys = list(keys)
+        await self.invalidate(keys)
+        uow = database.current_unit_of_work()
+        if uow is not None:
+            uow.after_commit(lambda: self.invalidate(keys))
+
+    async def listen(self) -> None:
+        while True:
+            try:
+                redis_client = await redis_service.connect()
+                async with redis_client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    while True:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                        if message is not None:
+                            self._apply_remote_invalidation(message["data"])
+            except Exception as exception:
+                logger.warning(f"Cache invalidation listener error: {exception!r}")
+                # Invalidations may have been missed while disconnected.
+                self.local.clear()
+                await asyncio.sleep(1)
+
+    def _apply_remote_invalidation(self, data: str) -> None:
+        try:
+            keys = json.loads(data)
+            if not isinstance(keys, list) or not all(isinstance(key, str) for key in keys):
+                raise ValueError("expected a list of keys")
+            self.local.delete(*keys)
+        except (TypeError, ValueError) as exception:
+            logger.warning(f"Ignoring malformed cache invalidation {data!r}: {exception}")
+            return
+        self._notify(keys)
+
+    async def start_listener(self) -> None:
+        if self.enabled and self.listener_task is None:
+            self.listener_task = asyncio.create_task(self.listen())
+
+    async def stop_listener(self) -> None:
+        if self.listener_task is not None:
+            self.listener_task.cancel()
+            await asyncio.gather(self.listener_task, return_exceptions=True)
+            self.listener_task = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "local": self.local.stats(),
+            "redis_hits": self.redis_hits,
+            "redis_misses": self.redis_misses,
+            "redis_errors": self.redis_errors,
+            "invalidations": self.invalidations,
+            "pending_invalidations": len(self._pending_invalidations),
+        }
+
+
+dao_cache: DAOCache = DAOCache(
+    settings.cache_enabled,
+    settings.cache_local_size,
+    settings.cache_local_ttl_seconds,
+    settings.cache_redis_ttl_seconds,
+    settings.cache_invalidation_channel,
+)
+
+
+def cached() -> Callable[[F], F]:
+    """
+    Cache the rows returned by a DAO point lookup.
+
+    The key is built by ``BaseDAO.cache_key`` from the method name and its
+    arguments, so ``cache_keys`` can rebuild it from a written row. Only the
+    row's columns are cached: a related row embedded in the entry would not
+    be invalidated by writes to it. ``None`` results are never cached, DAOs
+    with ``cacheable = False`` are never cached, and the cache is bypassed
+    once the active unit of work has written, so a request always reads its
+    own writes.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            uow = database.current_unit_of_work()
+            if not dao_cache.enabled or not self.cacheable or (uow is not None and uow.has_writes):
+                return await func(self, *args, **kwargs)
+
+            bound = signature.bind_partial(self, *args, **kwargs)
+            values = [value for name, value in bound.arguments.items() if name not in ("self", "session")]
+            key = self.cache_key(func.__name__, *values)
+
+            data = await dao_cache.get(key)
+            if data is not None:
+                return load_model(self.model, data)
+
+            result = await func(self, *args, **kwargs)
+            if result is not None:
+                await dao_cache.set(key, dump_model(result))
+            return result
+
+        return cast(F, wrapper)
+
+    return decorator
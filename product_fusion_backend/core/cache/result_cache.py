@@ -0,0 +1,186 @@
+import asyncio
+import contextvars
+import json
+import time
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+
+from loguru import logger
+from redis.exceptions import RedisError
+
+from product_fusion_backend.core.cache.dao_cache import REDIS_RETRY_SECONDS
+from product_fusion_backend.core.services.redis_service import redis_service
+from product_fusion_backend.settings import settings
+
+# How often a worker that lost the lock checks whether the winner has
+# published the result.
+LOCK_POLL_SECONDS = 0.05
+
+
+class CachedResult(NamedTuple):
+    value: Any
+    age: float
+    state: str
+
+    def headers(self) -> dict[str, str]:
+        return {"Age": str(int(self.age)), "X-Cache": self.state}
+
+
+class ResultCache:
+    """
+    Shared cache for expensive query results with single-flight loading.
+
+    Results are stored in Redis with the time they were computed. Within
+    ``ttl`` they are served as hits; for ``stale_ttl`` more they are still
+    served while one background refresh runs. Concurrent misses for the same
+    key share a single computation: in-process through a shared task, across
+    workers through a Redis lock whose losers wait for the winner's result.
+    """
+
+    def __init__(self, namespace: str, ttl: float, stale_ttl: float, lock_timeout: float) -> None:
+        self.namespace = namespace
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.lock_timeout = lock_timeout
+        self._inflight: dict[str, asyncio.Task[CachedResult]] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+        self._redis_down_until = 0.0
+
+    def _redis_available(self) -> bool:
+        return time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, action: str, exception: RedisError) -> None:
+        self.errors += 1
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(f"Result cache {action} failed: {exception}")
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> CachedResult:
+        """
+        Return the cached result for ``key``, computing it at most once.
+
+        :param key: normalized cache key.
+        :param compute: coroutine function producing a JSON-serializable value.
+        :return: value, its age in seconds and ``HIT``, ``STALE`` or ``MISS``.
+        """
+        if self.ttl <= 0:
+            return CachedResult(await compute(), 0.0, "MISS")
+
+        entry = await self._read(key)
+        if entry is not None:
+            value, computed_at = entry
+            age = max(time.time() - computed_at, 0.0)
+            if age < self.ttl:
+                self.hits += 1
+                return CachedResult(value, age, "HIT")
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._load(key, compute)
+                return CachedResult(value, age, "STALE")
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = self._load(key, compute)
+        return await asyncio.shield(task)
+
+    def _load(self, key: str, compute: Callable[[], Awaitable[Any]]) -> asyncio.Task[CachedResult]:
+        task = self._inflight.get(key)
+        if task is not None:
+            return task
+        # The load outlives the request that started it, so it must not run
+        # inside that request's unit of work.
+        task = asyncio.create_task(self._compute(key, compute), context=contextvars.Context())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finished(key, done))
+        return task
+
+    def _finished(self, key: str, task: asyncio.Task[CachedResult]) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Result cache load of {key} failed: {task.exception()!r}")
+
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> CachedResult:
+        if not self._redis_available():
+            return await self._compute_and_store(key, compute)
+        try:
+            redis_client = await redis_service.connect()
+            lock = redis_client.lock(f"lock:{self._key(key)}", timeout=self.lock_timeout)
+            if not await lock.acquire(blocking=False):
+                shared = await self._wait_for_other_worker(key)
+                if shared is not None:
+                    return shared
+                return await self._compute_and_store(key, compute)
+        except RedisError as exception:
+            self._redis_failed("lock", exception)
+            return await self._compute_and_store(key, compute)
+
+        try:
+            return await self._compute_and_store(key, compute)
+        finally:
+            try:
+                await lock.release()
+            except RedisError as exception:
+                logger.warning(f"Result cache lock release failed: {exception}")
+
+    async def _wait_for_other_worker(self, key: str) -> Optional[CachedResult]:
+        started = time.time()
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_SECONDS)
+            entry = await self._read(key)
+            if entry is not None and entry[1] >= started - LOCK_POLL_SECONDS:
+                self.coalesced += 1
+                return CachedResult(entry[0], max(time.time() - entry[1], 0.0), "MISS")
+        return None
+
+    async def _compute_and_store(self, key: str, compute: Callable[[], Awaitable[Any]]) -> CachedResult:
+        value = await compute()
+        if not self._redis_available():
+            return CachedResult(value, 0.0, "MISS")
+        payload = json.dumps({"value": value, "computed_at": time.time()}, default=str)
+        try:
+            redis_client = await redis_service.connect()
+            await redis_client.set(self._key(key), payload, ex=max(int(self.ttl + self.stale_ttl), 1))
+        except RedisError as exception:
+            self._redis_failed("write", exception)
+        return CachedResult(value, 0.0, "MISS")
+
+    async def _read(self, key: str) -> Optional[tuple[Any, float]]:
+        if not self._redis_available():
+            return None
+        try:
+            redis_client = await redis_service.connect()
+            payload = await redis_client.get(self._key(key))
+        except RedisError as exception:
+            self._redis_failed("read", exception)
+            return None
+        if payload is None:
+            return None
+        entry = json.loads(payload)
+        return entry["value"], entry["computed_at"]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "in_flight": len(self._inflight),
+        }
+
+
+stats_cache: ResultCache = ResultCache(
+    "stats",
+    settings.stats_cache_ttl_seconds,
+    settings.stats_cache_stale_seconds,
+    settings.stats_cache_lock_timeout_seconds,
+)
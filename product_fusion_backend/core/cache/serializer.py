@@ -0,0 +1,52 @@
+import json
+from datetime import datetime
+from typing import Any, Type, TypeVar
+
+from sqlalchemy import DateTime, inspect
+from sqlalchemy.orm import Mapper, make_transient_to_detached
+
+T = TypeVar("T")
+
+
+def _columns(obj: Any) -> dict[str, Any]:
+    mapper: Mapper[Any] = inspect(type(obj))
+    values = {}
+    for attr in mapper.column_attrs:
+        value = getattr(obj, attr.key)
+        values[attr.key] = value.isoformat() if isinstance(value, datetime) else value
+    return values
+
+
+def _restore(model: Type[T], values: dict[str, Any]) -> T:
+    mapper: Mapper[Any] = inspect(model, raiseerr=True)
+    for attr in mapper.column_attrs:
+        value = values.get(attr.key)
+        if value is not None and isinstance(attr.columns[0].type, DateTime):
+            values[attr.key] = datetime.fromisoformat(value)
+    obj = model(**values)
+    make_transient_to_detached(obj)
+    return obj
+
+
+def dump_model(obj: Any) -> str:
+    """
+    Serialize the columns of a loaded row to JSON.
+
+    :param obj: ORM instance.
+    :return: JSON payload.
+    """
+    return json.dumps(_columns(obj))
+
+
+def load_model(model: Type[T], data: str) -> T:
+    """
+    Rebuild a detached instance from a ``dump_model`` payload.
+
+    The instance behaves like one loaded by a session that has since been
+    closed: its columns are populated, nothing is lazy-loadable.
+
+    :param model: mapped class of the payload.
+    :param data: JSON payload.
+    :return: detached instance.
+    """
+    return _restore(model, json.loads(data))
@@ -33,6 +33,7 @@ class APIResponse(JSONResponse):
         message: str,
         data: Optional[dict[str, Any] | list[dict[str, Any]]] = None,
         status_code: int = status.HTTP_200_OK,
+        headers: Optional[dict[str, str]] = None,
     ):
         content = CommonResponseSchema(status=status_, message=message, data=data).model_dump(exclude_none=True)
-        super().__init__(content=content, status_code=status_code)
+        super().__init__(content=content, status_code=status_code, headers=headers)
@@ -1,30 +1,142 @@
+import asyncio
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from typing import Any, Optional
 
-from aiosmtplib import SMTP
+from aiosmtplib import SMTP, SMTPResponseException, SMTPServerDisconnected
+from loguru import logger
 
 from product_fusion_backend.settings import settings
 
 
+class PooledSMTPConnection:
+    __slots__ = ("smtp", "messages_sent", "last_used")
+
+    def __init__(self, smtp: SMTP) -> None:
+        self.smtp = smtp
+        self.messages_sent = 0
+        self.last_used = time.monotonic()
+
+
 class EmailService:
-    @staticmethod
-    async def send_email(to_email: str, subject: str, body: str) -> bool:
+    """
+    Sends emails over a pool of long-lived authenticated SMTP sessions.
+
+    Idle sessions are checked with NOOP before reuse, recycled after
+    ``max_messages_per_connection`` messages and replaced when the server
+    drops them. At most ``pool_size`` messages are in flight at once.
+    """
+
+    def __init__(self, pool_size: int, max_messages_per_connection: int, idle_check_seconds: float) -> None:
+        self.pool_size = pool_size
+        self.max_messages_per_connection = max_messages_per_connection
+        self.idle_check_seconds = idle_check_seconds
+        self._idle: list[PooledSMTPConnection] = []
+        self._semaphore = asyncio.Semaphore(pool_size)
+        self._in_use = 0
+
+    async def send_email(self, to_email: str, subject: str, body: str) -> bool:
         message = MIMEMultipart()
         message["From"] = settings.smtp_username
         message["To"] = to_email
         message["Subject"] = subject
         message.attach(MIMEText(body, "html"))
 
+        async with self._semaphore:
+            for attempt in range(2):
+                connection: Optional[PooledSMTPConnection] = None
+                try:
+                    connection = await self._acquire()
+                    await connection.smtp.send_message(message)
+                    connection.messages_sent += 1
+                    await self._release(connection)
+                    return True
+                except SMTPResponseException as exception:
+                    logger.error(f"Failed to send email: {exception}")
+                    if connection is not None:
+                        await self._reset(connection)
+                    return False
+                except (SMTPServerDisconnected, OSError, asyncio.TimeoutError) as exception:
+                    await self._discard(connection)
+                    logger.warning(f"SMTP connection lost (attempt {attempt + 1}): {exception}")
+                except Exception as exception:
+                    await self._discard(connection)
+                    logger.error(f"Failed to send email: {exception}")
+                    return False
+        return False
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pool_size": self.pool_size,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+        }
+
+    async def close(self) -> None:
+        while self._idle:
+            await self._quit(self._idle.pop())
+
+    async def _acquire(self) -> PooledSMTPConnection:
+        while self._idle:
+            connection = self._idle.pop()
+            if time.monotonic() - connection.last_used < self.idle_check_seconds:
+                self._in_use += 1
+                return connection
+            try:
+                await connection.smtp.noop()
+                self._in_use += 1
+                return connection
+            except Exception:
+                await self._quit(connection)
+
+        smtp = SMTP(
+            hostname=settings.smtp_server,
+            port=settings.smtp_port,
+            use_tls=True,
+            timeout=settings.smtp_timeout,
+        )
         try:
-            smtp = SMTP(hostname=settings.smtp_server, port=settings.smtp_port, use_tls=True)
             await smtp.connect()
             await smtp.login(settings.smtp_username, settings.smtp_password)
-            await smtp.send_message(message)
-            await smtp.quit()
-            return True
-        except Exception as e:
-            print(f"Failed to send email: {str(e)}")
-            return False
+        except Exception:
+            smtp.close()
+            raise
+        self._in_use += 1
+        return PooledSMTPConnection(smtp)
+
+    async def _release(self, connection: PooledSMTPConnection) -> None:
+        self._in_use -= 1
+        if connection.messages_sent >= self.max_messages_per_connection:
+            await self._quit(connection)
+            return
+        connection.last_used = time.monotonic()
+        self._idle.append(connection)
+
+    async def _reset(self, connection: PooledSMTPConnection) -> None:
+        try:
+            await connection.smtp.rset()
+        except Exception:
+            await self._discard(connection)
+            return
+        await self._release(connection)
+
+    async def _discard(self, connection: Optional[PooledSMTPConnection]) -> None:
+        if connection is None:
+            return
+        self._in_use -= 1
+        await self._quit(connection)
+
+    @staticmethod
+    async def _quit(connection: PooledSMTPConnection) -> None:
+        try:
+            await connection.smtp.quit()
+        except Exception:
+            connection.smtp.close()
 
 
-email_service = EmailService()
+email_service = EmailService(
+    pool_size=settings.smtp_pool_size,
+    max_messages_per_connection=settings.smtp_max_messages_per_connection,
+    idle_check_seconds=settings.smtp_idle_check_seconds,
+)
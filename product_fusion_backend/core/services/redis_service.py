@@ -1,32 +1,94 @@
 import asyncio
 import json
-from typing import Any
+import socket
+from typing import Any, Optional
 
 from loguru import logger
-from redis.asyncio import Redis
+from redis.asyncio import ConnectionPool, Redis
+from redis.exceptions import RedisError, ResponseError
 
-from product_fusion_backend.core import email_service
+from product_fusion_backend.connections import database
+from product_fusion_backend.core.services.email_service import email_service
+from product_fusion_backend.core.utils.email_templates import email_templates
+from product_fusion_backend.settings import settings
 
 
 class RedisService:
-    @staticmethod
-    async def connect() -> Redis:
-        return Redis(
-            host="localhost",
-            port=6379,
-            db=0,
+    pool: Optional[ConnectionPool] = None
+    client: Optional[Redis] = None
+    subscriber_task: Optional[asyncio.Task[None]] = None
+
+    @classmethod
+    async def startup(cls) -> None:
+        if cls.pool is not None:
+            return
+        cls.pool = ConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_connect_timeout,
+            decode_responses=True,
         )
+        cls.client = Redis(connection_pool=cls.pool)
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        if cls.client is not None:
+            await cls.client.aclose()
+            cls.client = None
+        if cls.pool is not None:
+            await cls.pool.disconnect()
+            cls.pool = None
+
+    @classmethod
+    async def connect(cls) -> Redis:
+        if cls.client is None:
+            await cls.startup()
+        return cls.client  # type: ignore
 
     @classmethod
     async def insert(cls, email: str, data: dict[str, Any], queue: bool = False) -> None:
         redis_client: Redis = await cls.connect()
         data["status"] = "queued"
-        await redis_client.hset(
-            f"email:{email}",
-            mapping=data,
-        )
-        if queue:
-            await cls.publish(data)
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(
+                f"email:{email}",
+                mapping=data,
+            )
+            if queue:
+                cls._enqueue(pipe, data)
+            await pipe.execute()
+
+    @classmethod
+    async def queue_email(cls, email: str, template: str, params: dict[str, Any]) -> None:
+        """
+        Queue an email rendered from a registered template.
+
+        Only the template name, version and parameters travel through Redis;
+        the consumer renders the message. Inside a unit of work the email is
+        queued only once it commits, so links to tokens written by a request
+        that rolls back are never sent.
+
+        :param email: recipient address.
+        :param template: name of a template in the registry.
+        :param params: values for the template placeholders.
+        """
+        email_template = email_templates.get(template)
+        missing = email_template.fields - params.keys()
+        if missing:
+            raise KeyError(f"Missing parameters for template {template}: {sorted(missing)}")
+
+        data = {
+            "email": email,
+            "template": email_template.name,
+            "version": email_template.version,
+            "params": json.dumps(params),
+        }
+        uow = database.current_unit_of_work()
+        if uow is None:
+            await cls.insert(email, data, queue=True)
+        else:
+            uow.after_commit(lambda: cls.insert(email, data, queue=True))
 
     @classmethod
     async def update(cls, email: str) -> None:
@@ -46,41 +108,212 @@ class RedisService:
     @classmethod
     async def publish(cls, data: dict[str, Any]) -> None:
         redis_client: Redis = await cls.connect()
-        await redis_client.publish(
-            "email-channel",
-            json.dumps(data),
+        await cls._enqueue(redis_client, data)
+
+    @staticmethod
+    def _enqueue(redis_client: Redis, data: dict[str, Any]) -> Any:
+        return redis_client.xadd(
+            settings.email_stream,
+            {"payload": json.dumps(data)},
+            maxlen=settings.email_stream_maxlen,
+            approximate=True,
+        )
+
+    @classmethod
+    async def ensure_consumer_group(cls) -> None:
+        redis_client: Redis = await cls.connect()
+        try:
+            await redis_client.xgroup_create(
+                settings.email_stream,
+                settings.email_consumer_group,
+                id="0",
+                mkstream=True,
+            )
+        except ResponseError as exception:
+            if "BUSYGROUP" not in str(exception):
+                raise
+
+    @staticmethod
+    async def send_message(message_id: str, fields: dict[str, Any]) -> Optional[tuple[str, Optional[str]]]:
+        """
+        Render and send one queued email.
+
+        :param message_id: stream entry id, for logging.
+        :param fields: stream entry fields.
+        :return: ``("sent", email)`` once sent, ``("failed", email)`` for a
+            message that can never be sent, with ``email`` ``None`` when it is
+            unreadable, or ``None`` to leave the message pending for a retry.
+        """
+        data: Any = None
+        try:
+            data = json.loads(fields["payload"])
+            email = data["email"]
+            if "template" in data:
+                subject, body = email_templates.render(data["template"], json.loads(data["params"]), data["version"])
+            else:
+                subject, body = data["subject"], data["body"]
+        except Exception as exception:
+            logger.error(f"Malformed email message {message_id}: {exception!r}")
+            email = data.get("email") if isinstance(data, dict) else None
+            return "failed", email if isinstance(email, str) else None
+
+        try:
+            logger.info(f"Sending email to: {email}")
+            sent = await email_service.send_email(email, subject, body)
+        except Exception as exception:
+            logger.error(f"Sending email message {message_id} failed: {exception!r}")
+            return None
+        if not sent:
+            return None
+        logger.info("Email sent successfully.")
+        return "sent", email
+
+    @classmethod
+    async def dispatch_batch(cls, messages: list[tuple[str, dict[str, Any]]]) -> None:
+        """
+        Send a batch of queued emails concurrently.
+
+        At most ``email_max_in_flight`` emails are sent at the same time. The
+        status updates and acknowledgements of every email sent, or malformed,
+        are written back in a single pipeline; failed sends stay pending for a
+        retry.
+
+        :param messages: stream entries to dispatch.
+        """
+        if not messages:
+            return
+
+        semaphore = asyncio.Semaphore(settings.email_max_in_flight)
+
+        async def send(message_id: str, fields: dict[str, Any]) -> Optional[tuple[str, Optional[str]]]:
+            async with semaphore:
+                return await cls.send_message(message_id, fields)
+
+        results = await asyncio.gather(
+            *(send(message_id, fields) for message_id, fields in messages),
+            return_exceptions=True,
+        )
+        done = []
+        for (message_id, _fields), result in zip(messages, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Dispatching email message {message_id} failed: {result!r}")
+            elif result is not None:
+                done.append((message_id, *result))
+        if not done:
+            return
+
+        redis_client: Redis = await cls.connect()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for _message_id, status, email in done:
+                if email is not None:
+                    pipe.hset(f"email:{email}", "status", status)
+            pipe.xack(settings.email_stream, settings.email_consumer_group, *(message_id for message_id, *_ in done))
+            await pipe.execute()
+
+    @classmethod
+    async def reclaim_pending(cls, consumer: str) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Take over messages left unacknowledged by crashed or failing consumers.
+
+        Entries idle for longer than ``email_claim_idle_ms`` are claimed by the
+        given consumer. Entries already delivered ``email_max_deliveries`` times
+        are acknowledged and marked as failed instead of being retried forever.
+
+        :param consumer: name of the consumer taking over the messages.
+        :return: claimed messages to process.
+        """
+        redis_client: Redis = await cls.connect()
+        pending = await redis_client.xpending_range(
+            settings.email_stream,
+            settings.email_consumer_group,
+            min="-",
+            max="+",
+            count=settings.email_batch_size,
+            idle=settings.email_claim_idle_ms,
+        )
+        if not pending:
+            return []
+
+        exhausted = {
+            entry["message_id"] for entry in pending if entry["times_delivered"] >= settings.email_max_deliveries
+        }
+        claimed = await redis_client.xclaim(
+            settings.email_stream,
+            settings.email_consumer_group,
+            consumer,
+            min_idle_time=settings.email_claim_idle_ms,
+            message_ids=[entry["message_id"] for entry in pending],
         )
 
+        messages = []
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for message_id, fields in claimed:
+                if fields and message_id not in exhausted:
+                    messages.append((message_id, fields))
+                    continue
+                logger.error(f"Giving up on email message {message_id} after repeated failures.")
+                try:
+                    pipe.hset(f"email:{json.loads(fields['payload'])['email']}", "status", "failed")
+                except (KeyError, TypeError, ValueError):
+                    pass
+                pipe.xack(settings.email_stream, settings.email_consumer_group, message_id)
+            await pipe.execute()
+        return messages
+
     @classmethod
-    async def subscribe(cls, channel: str) -> None:
+    async def consume(cls, consumer: str) -> None:
         redis_client: Redis = await cls.connect()
-        subscriber = redis_client.pubsub()
-        await subscriber.subscribe(channel)
-        logger.info(f"Subscribed to channel: {channel}")
+        group_ready = False
+        # Start with the entries this consumer read but never acknowledged
+        # before a restart, then switch to new entries once they are drained.
+        last_id = "0"
+        logger.info(f"Consuming stream {settings.email_stream} as {consumer}")
         try:
-            async for message in subscriber.listen():
-                if message.get("type") == "message":
-                    logger.info("Received message")
-                    data = json.loads(message["data"])
-                    if data:
-                        logger.info(f"Sending email to: {data['email']}")
-                        sent = await email_service.send_email(
-                            data["email"],
-                            data["subject"],
-                            data["body"],
-                        )
-                        if sent:
-                            logger.info("Email sent successfully.")
-                            await cls.update(data["email"])
+            while True:
+                try:
+                    if not group_ready:
+                        await cls.ensure_consumer_group()
+                        group_ready = True
+                    messages = await cls.reclaim_pending(consumer)
+                    response = await redis_client.xreadgroup(
+                        settings.email_consumer_group,
+                        consumer,
+                        {settings.email_stream: last_id},
+                        count=settings.email_batch_size,
+                        block=settings.email_block_ms if last_id == ">" else None,
+                    )
+                    entries = [message for _stream, stream_messages in response for message in stream_messages]
+                    if last_id != ">":
+                        last_id = entries[-1][0] if entries else ">"
+                    messages.extend(entries)
+                    await cls.dispatch_batch(messages)
+                except RedisError as exception:
+                    logger.error(f"Email consumer error: {exception}")
+                    await asyncio.sleep(1)
+                except Exception as exception:
+                    logger.exception(f"Unexpected email consumer error: {exception!r}")
+                    await asyncio.sleep(1)
         except asyncio.CancelledError:
-            logger.info("Subscription task was cancelled, shutting down subscription.")
-            await subscriber.unsubscribe(channel)
-        finally:
-            await redis_client.close()
+            logger.info("Consumer task was cancelled, shutting down consumer.")
+
+    @staticmethod
+    def consumer_name() -> str:
+        """
+        Name this process consumes the email stream under.
+
+        The name must survive restarts: pending entries stay assigned to the
+        consumer that read them, so a name that changes on every start leaves
+        a dead consumer in the group each time. ``email_consumer_name`` is
+        used when set, otherwise the hostname; ``consume`` drains the entries
+        still pending under the name before reading new ones.
+
+        :return: consumer name.
+        """
+        return settings.email_consumer_name or socket.gethostname()
 
     @classmethod
-    async def start_subscriber(cls, channel: str) -> None:
-        cls.subscriber_task = asyncio.create_task(cls.subscribe(channel))
+    async def start_subscriber(cls) -> None:
+        cls.subscriber_task = asyncio.create_task(cls.consume(cls.consumer_name()))
 
     @classmethod
     async def stop_subscriber(cls) -> None:
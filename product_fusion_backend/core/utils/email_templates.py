@@ -0,0 +1,114 @@
+from collections import OrderedDict
+from string import Formatter
+from typing import Any, Optional
+
+from product_fusion_backend.core.utils.constants import (
+    INVITE_MEMBER_MAIL_TEMPLATE,
+    LOGIN_ALERT_MAIL_TEMPLATE,
+    PASSWORD_RESET_MAIL_TEMPLATE,
+    PASSWORD_UPDATE_MAIL_TEMPLATE,
+    VERIFY_EMAIL_TEMPLATE,
+    VERIFY_EMAIL_WITH_PASS_RESET_TEMPLATE,
+)
+from product_fusion_backend.settings import settings
+
+
+class EmailTemplate:
+    """
+    Email template compiled once into literal and placeholder segments.
+
+    Rendering only joins the segments, so the body is never re-parsed.
+    """
+
+    __slots__ = ("name", "version", "subject", "_segments")
+
+    def __init__(self, name: str, version: int, subject: str, body: str) -> None:
+        self.name = name
+        self.version = version
+        self.subject = subject
+        self._segments: list[tuple[str, Optional[str]]] = [
+            (literal, field_name) for literal, field_name, _spec, _conversion in Formatter().parse(body)
+        ]
+
+    @property
+    def fields(self) -> set[str]:
+        return {field_name for _literal, field_name in self._segments if field_name}
+
+    def render(self, params: dict[str, Any]) -> str:
+        parts = []
+        for literal, field_name in self._segments:
+            parts.append(literal)
+            if field_name:
+                parts.append(str(params[field_name]))
+        return "".join(parts)
+
+
+class EmailTemplateRegistry:
+    """
+    Versioned registry of email templates.
+
+    The request path only enqueues a template name and its parameters; the
+    email worker renders the message. Rendered messages are cached per
+    template version and parameter set.
+    """
+
+    def __init__(self, cache_size: int) -> None:
+        self.cache_size = cache_size
+        self._templates: dict[str, dict[int, EmailTemplate]] = {}
+        self._rendered: OrderedDict[tuple[Any, ...], tuple[str, str]] = OrderedDict()
+
+    def register(self, template: EmailTemplate) -> None:
+        self._templates.setdefault(template.name, {})[template.version] = template
+
+    def get(self, name: str, version: Optional[int] = None) -> EmailTemplate:
+        versions = self._templates[name]
+        return versions[version if version is not None else max(versions)]
+
+    def render(self, name: str, params: dict[str, Any], version: Optional[int] = None) -> tuple[str, str]:
+        """
+        Render a template.
+
+        :param name: template name.
+        :param params: values for the template placeholders.
+        :param version: template version, the latest one when omitted.
+        :return: subject and body of the email.
+        """
+        template = self.get(name, version)
+        key = (template.name, template.version, tuple(sorted(params.items())))
+        rendered = self._rendered.get(key)
+        if rendered is not None:
+            self._rendered.move_to_end(key)
+            return rendered
+
+        rendered = (template.subject, template.render(params))
+        if self.cache_size > 0:
+            self._rendered[key] = rendered
+            if len(self._rendered) > self.cache_size:
+                self._rendered.popitem(last=False)
+        return rendered
+
+
+email_templates = EmailTemplateRegistry(cache_size=settings.email_render_cache_size)
+email_templates.register(
+    EmailTemplate("verify_email", 1, "Welcome - Verify Your Email", VERIFY_EMAIL_TEMPLATE),
+)
+email_templates.register(
+    EmailTemplate("login_alert", 1, "New Login Detected", LOGIN_ALERT_MAIL_TEMPLATE),
+)
+email_templates.register(
+    EmailTemplate("password_reset", 1, "Password Reset Request", PASSWORD_RESET_MAIL_TEMPLATE),
+)
+email_templates.register(
+    EmailTemplate("password_update", 1, "Password Updated", PASSWORD_UPDATE_MAIL_TEMPLATE),
+)
+email_templates.register(
+    EmailTemplate("invite_member", 1, "Invitation to join organization", INVITE_MEMBER_MAIL_TEMPLATE),
+)
+email_templates.register(
+    EmailTemplate(
+        "verify_email_with_password_reset",
+        1,
+        "Verify Your Email and Set Password",
+        VERIFY_EMAIL_WITH_PASS_RESET_TEMPLATE,
+    ),
+)
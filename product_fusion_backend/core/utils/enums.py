@@ -1,7 +1,30 @@
-from enum import Enum
+from enum import Enum, IntFlag
 
 
 class StatusEnum(str, Enum):
     SUCCESS = "success"
     ERROR = "error"
     FAILURE = "failure"
+
+
+class Permission(IntFlag):
+    """Actions a role can be allowed within its organization."""
+
+    NONE = 0
+    VIEW_MEMBERS = 1
+    INVITE_MEMBER = 2
+    REMOVE_MEMBER = 4
+    UPDATE_MEMBER_ROLE = 8
+    MANAGE_ROLES = 16
+    MANAGE_ORGANIZATION = 32
+    ALL = VIEW_MEMBERS | INVITE_MEMBER | REMOVE_MEMBER | UPDATE_MEMBER_ROLE | MANAGE_ROLES | MANAGE_ORGANIZATION
+
+
+# Permissions of the built-in roles, used when they are created.
+ROLE_PERMISSIONS: dict[str, Permission] = {
+    "owner": Permission.ALL,
+    "admin": (
+        Permission.VIEW_MEMBERS | Permission.INVITE_MEMBER | Permission.REMOVE_MEMBER | Permission.UPDATE_MEMBER_ROLE
+    ),
+    "member": Permission.VIEW_MEMBERS,
+}
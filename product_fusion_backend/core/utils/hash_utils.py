@@ -1,16 +1,129 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
 from bcrypt import checkpw, gensalt, hashpw
 
+from product_fusion_backend.settings import HashExecutorType, settings
+
+R = TypeVar("R")
+
+
+class HashPoolSaturatedError(Exception):
+    """Raised when the hashing pool already has the maximum number of queued jobs."""
+
+
+def _hash(password: bytes, salt: bytes) -> bytes:
+    return hashpw(password, salt)
+
+
+def _verify(password: bytes, hashed_password: bytes) -> bool:
+    return checkpw(password, hashed_password)
+
 
 class HashManager:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        executor_type: HashExecutorType = HashExecutorType.THREAD,
+        max_workers: int = 4,
+        max_pending: int = 32,
+    ) -> None:
         self.salt = gensalt()
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    async def hash_password_async(self, password: str) -> str:
+        """
+        Hash a password on the hashing pool instead of the event loop.
+
+        :param password: plain text password.
+        :return: bcrypt hash.
+        :raises HashPoolSaturatedError: when the pool queue is full.
+        """
+        hashed = await self._submit(_hash, password.encode(), self.salt)
+        return hashed.decode()
+
+    async def verify_password_async(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify a password on the hashing pool instead of the event loop.
+
+        :param password: plain text password.
+        :param hashed_password: stored bcrypt hash.
+        :return: whether the password matches.
+        :raises HashPoolSaturatedError: when the pool queue is full.
+        """
+        return await self._submit(_verify, password.encode(), hashed_password.encode())
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self._in_flight - self.max_workers, 0)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "executor": self.executor_type.value,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "completed": self._completed,
+            "failed": self._failed,
+            "cancelled": self._cancelled,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == HashExecutorType.PROCESS:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _submit(self, func: Callable[..., R], *args: Any) -> R:
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_pending:
+                self._rejected += 1
+                raise HashPoolSaturatedError("Password hashing pool is saturated")
+            self._in_flight += 1
 
-    def hash_password(self, password: str) -> str:
-        return hashpw(password.encode(), self.salt).decode()
+        try:
+            future = self._get_executor().submit(func, *args)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        # The slot is released when the job itself ends, not when the caller
+        # stops waiting: a cancelled request leaves its hash running.
+        future.add_done_callback(self._job_done)
+        return await asyncio.wrap_future(future)
 
-    @staticmethod
-    def verify_password(password: str, hashed_password: str) -> bool:
-        return checkpw(password.encode(), hashed_password.encode())
+    def _job_done(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if future.cancelled():
+                self._cancelled += 1
+            elif future.exception() is not None:
+                self._failed += 1
+            else:
+                self._completed += 1
 
 
-hash_manager: HashManager = HashManager()
+hash_manager: HashManager = HashManager(
+    executor_type=settings.hash_executor,
+    max_workers=settings.hash_max_workers,
+    max_pending=settings.hash_max_pending,
+)
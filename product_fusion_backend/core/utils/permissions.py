@@ -0,0 +1,79 @@
+import asyncio
+from typing import Awaitable, Callable, Iterable, Optional
+
+from loguru import logger
+
+from product_fusion_backend.core.cache.dao_cache import dao_cache
+from product_fusion_backend.core.utils.enums import Permission
+from product_fusion_backend.settings import settings
+
+
+class PermissionTable:
+    """
+    In-process ``(org_id, role_id) -> permission mask`` table.
+
+    Loaded from the role table at startup and reloaded periodically. Role
+    writes drop the affected entries through the DAO cache invalidations,
+    local and broadcast, so the next check reloads that single role.
+    """
+
+    def __init__(self, refresh_seconds: float) -> None:
+        self.refresh_seconds = refresh_seconds
+        self._masks: dict[tuple[int, int], int] = {}
+        self._role_orgs: dict[int, int] = {}
+        self.refresh_task: Optional[asyncio.Task[None]] = None
+
+    def load(self, rows: Iterable[tuple[int, int, int]]) -> None:
+        masks, role_orgs = {}, {}
+        for org_id, role_id, mask in rows:
+            masks[(org_id, role_id)] = mask
+            role_orgs[role_id] = org_id
+        self._masks, self._role_orgs = masks, role_orgs
+
+    def get(self, org_id: int, role_id: int) -> Optional[int]:
+        return self._masks.get((org_id, role_id))
+
+    def set(self, org_id: int, role_id: int, mask: int) -> None:
+        self._masks[(org_id, role_id)] = mask
+        self._role_orgs[role_id] = org_id
+
+    def discard(self, role_id: int) -> None:
+        org_id = self._role_orgs.pop(role_id, None)
+        if org_id is not None:
+            self._masks.pop((org_id, role_id), None)
+
+    @staticmethod
+    def allows(mask: Optional[int], permission: Permission) -> bool:
+        return mask is not None and mask & permission == permission
+
+    def on_invalidate(self, keys: list[str]) -> None:
+        for key in keys:
+            table, method, *values = key.split(":")
+            if table == "role" and method == "get" and values:
+                self.discard(int(values[0]))
+
+    async def start(self, loader: Callable[..., Awaitable[Iterable[tuple[int, int, int]]]]) -> None:
+        self.load(await loader())
+        if self.refresh_seconds > 0 and self.refresh_task is None:
+            self.refresh_task = asyncio.create_task(self._refresh(loader))
+
+    async def stop(self) -> None:
+        if self.refresh_task is not None:
+            self.refresh_task.cancel()
+            await asyncio.gather(self.refresh_task, return_exceptions=True)
+            self.refresh_task = None
+
+    async def _refresh(self, loader: Callable[..., Awaitable[Iterable[tuple[int, int, int]]]]) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                self.load(await loader())
+            except Exception as exception:
+                logger.error(f"Reloading role permissions failed: {exception}")
+
+    def __len__(self) -> int:
+        return len(self._masks)
+
+
+permission_table: PermissionTable = PermissionTable(settings.permission_refresh_seconds)
+dao_cache.add_invalidation_listener(permission_table.on_invalidate)
@@ -0,0 +1,65 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from product_fusion_backend.settings import settings
+
+
+class TokenCache:
+    """
+    Bounded LRU of verified JWT claims keyed by the token digest.
+
+    Entries are served only while the token's ``exp`` has not passed, using
+    the same comparison as ``JWTClaims.validate``. All operations are
+    synchronous, so concurrent requests on the event loop never observe a
+    partially updated cache.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[Optional[int], dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict[str, Any]]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, claims = entry
+        if expires_at is not None and expires_at < int(time.time()):
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return claims
+
+    def set(self, token: str, claims: dict[str, Any]) -> None:
+        if self.max_size <= 0:
+            return
+        key = self._key(token)
+        expires_at = claims.get("exp")
+        self._entries[key] = (int(expires_at) if expires_at is not None else None, dict(claims))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+token_cache: TokenCache = TokenCache(settings.token_cache_size)
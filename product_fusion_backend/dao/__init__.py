@@ -1,11 +1,25 @@
-from product_fusion_backend.dao.member_dao import MemberDAO
+from product_fusion_backend.dao.authorization import authorize, role_allows
+from product_fusion_backend.dao.base_dao import Page
+from product_fusion_backend.dao.member_counter_dao import MemberCounterDAO
+from product_fusion_backend.dao.member_dao import MemberDAO, MemberRef
+from product_fusion_backend.dao.member_snapshot_dao import MemberSnapshotDAO
 from product_fusion_backend.dao.organization_dao import OrganizationDAO
 from product_fusion_backend.dao.role_dao import RoleDAO
-from product_fusion_backend.dao.user_dao import UserDAO
+from product_fusion_backend.dao.user_dao import Membership, Principal, UserCredentials, UserDAO, UserRef
 
 __all__ = [
+    "MemberCounterDAO",
     "MemberDAO",
+    "MemberRef",
+    "MemberSnapshotDAO",
+    "Membership",
     "OrganizationDAO",
+    "Page",
+    "Principal",
     "RoleDAO",
+    "UserCredentials",
     "UserDAO",
+    "UserRef",
+    "authorize",
+    "role_allows",
 ]
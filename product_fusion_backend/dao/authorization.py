@@ -0,0 +1,42 @@
+from typing import Optional
+
+from product_fusion_backend.core.utils.enums import Permission
+from product_fusion_backend.core.utils.permissions import permission_table
+from product_fusion_backend.dao.member_dao import MemberDAO
+from product_fusion_backend.dao.role_dao import RoleDAO
+
+
+async def role_allows(org_id: int, role_id: Optional[int], permission: Permission) -> bool:
+    """
+    Check whether a role of ``org_id`` grants ``permission``.
+
+    Answered from the in-process permission table; a role missing from it,
+    created or changed since the last load, is read from the database once.
+
+    :param org_id: organization the action applies to.
+    :param role_id: role of the acting member, ``None`` for non-members.
+    :param permission: permission, or combination of permissions, required.
+    :return: whether every requested permission is granted.
+    """
+    if role_id is None:
+        return False
+    mask = permission_table.get(org_id, role_id)
+    if mask is None:
+        mask = await RoleDAO().get_permission_mask(org_id, role_id)  # type: ignore
+        if mask is None:
+            return False
+        permission_table.set(org_id, role_id, mask)
+    return permission_table.allows(mask, permission)
+
+
+async def authorize(user_id: int, org_id: int, permission: Permission) -> bool:
+    """
+    Check whether ``user_id`` holds ``permission`` in ``org_id``.
+
+    :param user_id: acting user.
+    :param org_id: organization the action applies to.
+    :param permission: permission, or combination of permissions, required.
+    :return: whether the user is a member whose role grants it.
+    """
+    member = await MemberDAO().get_by_user_and_org(user_id, org_id)  # type: ignore
+    return await role_allows(org_id, member.role_id if member is not None else None, permission)
@@ -1,31 +1,63 @@
 # app/dao/base.py
-from typing import Any, Generic, Optional, Sequence, Type, TypeVar
+import base64
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, ClassVar, Generic, NamedTuple, Optional, Sequence, Type, TypeVar
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import ColumnElement, and_, delete, func, insert, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from product_fusion_backend.connections import inject_session
+from product_fusion_backend.connections import database, inject_session
+from product_fusion_backend.core.cache import cached, dao_cache
 
 T = TypeVar("T")
+P = TypeVar("P", bound=tuple[Any, ...])
+
+PAGE_ORDER_COLUMNS = ("id", "created_at")
+
+
+class Page(NamedTuple, Generic[T]):
+    items: Sequence[T]
+    next_cursor: Optional[str]
 
 
 class BaseDAO(Generic[T]):
+    # Columns of the unique index used as the ON CONFLICT target by upserts.
+    conflict_keys: ClassVar[tuple[str, ...]] = ("id",)
+    # Whether @cached lookups may copy rows into the shared cache.
+    cacheable: ClassVar[bool] = True
+
     def __init__(self, model: Type[T]):
         self.model = model
 
+    def cache_key(self, method: str, *values: Any) -> str:
+        return ":".join([self.model.__tablename__, method, *(str(value) for value in values)])  # type: ignore
+
+    def cache_keys(self, obj: T) -> list[str]:
+        """
+        Keys of every cached lookup that can return ``obj``.
+
+        DAOs that cache lookups by other columns extend this list.
+        """
+        return [self.cache_key("get", obj.id)]  # type: ignore
+
+    async def _invalidate(self, objs: Sequence[T]) -> None:
+        await dao_cache.invalidate_after_commit(key for obj in objs for key in self.cache_keys(obj))
+
     @inject_session
     async def create(self, obj_in: dict[Any, Any], session: AsyncSession) -> T:
         try:
             db_obj = self.model(**obj_in)
             session.add(db_obj)
-            await session.commit()
+            await session.flush()
             await session.refresh(db_obj)
             return db_obj
         except SQLAlchemyError as exception:
-            await session.rollback()
             raise exception
 
+    @cached()
     @inject_session
     async def get(self, unique_id: int, session: AsyncSession) -> Optional[T]:
         try:
@@ -35,7 +67,7 @@ class BaseDAO(Generic[T]):
         except SQLAlchemyError as exception:
             raise exception
 
-    @inject_session
+    @inject_session(read_only=True)
     async def get_all(self, session: AsyncSession) -> Sequence[T]:
         try:
             statement = select(self.model)
@@ -44,6 +76,148 @@ class BaseDAO(Generic[T]):
         except SQLAlchemyError as exception:
             raise exception
 
+    async def get_projection(self, unique_id: int, projection: Type[P]) -> Optional[P]:
+        """
+        Read a subset of one row's columns.
+
+        :param unique_id: primary key of the row.
+        :param projection: named tuple whose field names are the columns to read.
+        :return: the projected row, ``None`` if it does not exist.
+        """
+        rows = await self.get_projections(projection, self.model.id == int(unique_id), limit=1)  # type: ignore
+        return rows[0] if rows else None
+
+    @inject_session
+    async def get_projections(
+        self,
+        projection: Type[P],
+        *conditions: ColumnElement[bool],
+        session: AsyncSession,
+        limit: Optional[int] = None,
+    ) -> list[P]:
+        """
+        Read a subset of the columns of every matching row.
+
+        Rows come back as named tuples instead of entities, skipping instance
+        construction, attribute instrumentation and the identity map.
+
+        :param projection: named tuple whose field names are the columns to read.
+        :param conditions: optional filters.
+        :param limit: maximum number of rows.
+        :return: projected rows.
+        """
+        columns = [getattr(self.model, name) for name in projection._fields]  # type: ignore
+        statement = select(*columns).where(*conditions).limit(limit)
+        try:
+            result = await session.execute(statement)
+            return list(map(projection._make, result.tuples()))  # type: ignore
+        except SQLAlchemyError as exception:
+            raise exception
+
+    async def stream_all(
+        self,
+        *conditions: ColumnElement[bool],
+        batch_size: int = 1000,
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over every matching row without loading the table into memory.
+
+        Rows are fetched from a server-side cursor ``batch_size`` at a time,
+        on a connection of its own, so other DAO calls may be awaited while
+        iterating; rows written but not yet committed by the caller's unit of
+        work are not seen.
+
+        :param conditions: optional filters.
+        :param batch_size: rows fetched per round trip.
+        :yields: rows in primary key order.
+        """
+        statement = (
+            select(self.model)
+            .where(*conditions)
+            .order_by(self.model.id)  # type: ignore
+            .execution_options(yield_per=batch_size)
+        )
+        async with database.session() as session:
+            try:
+                result = await session.stream_scalars(statement)
+                async for row in result:
+                    yield row
+            except SQLAlchemyError as exception:
+                raise exception
+
+    @inject_session(read_only=True)
+    async def get_page(
+        self,
+        *conditions: ColumnElement[bool],
+        session: AsyncSession,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        order_by: str = "id",
+    ) -> Page[T]:
+        """
+        Fetch one page of rows using keyset pagination.
+
+        The cursor encodes the last row's sort key, so each page is an index
+        range scan no matter how deep into the table it is.
+
+        :param conditions: optional filters.
+        :param limit: maximum rows per page.
+        :param cursor: ``next_cursor`` of the previous page.
+        :param order_by: ``id`` or ``created_at``; ties are broken by ``id``
+            and rows without ``created_at`` come last.
+        :return: page of rows and the cursor of the next page, if any.
+        """
+        if order_by not in PAGE_ORDER_COLUMNS:
+            raise ValueError(f"Pagination is only supported on {', '.join(PAGE_ORDER_COLUMNS)}")
+
+        id_column = self.model.id  # type: ignore
+        statement = select(self.model).where(*conditions).limit(limit + 1)
+        if order_by == "id":
+            statement = statement.order_by(id_column)
+            if cursor is not None:
+                statement = statement.where(id_column > self._decode_cursor(cursor, order_by)[0])
+        else:
+            # The column is nullable: rows without a value sort last, after
+            # every dated row, and are then ordered by id alone.
+            column = getattr(self.model, order_by)
+            statement = statement.order_by(column.asc().nulls_last(), id_column)
+            if cursor is not None:
+                after, after_id = self._decode_cursor(cursor, order_by)
+                if after is None:
+                    statement = statement.where(column.is_(None), id_column > after_id)
+                else:
+                    statement = statement.where(
+                        or_(tuple_(column, id_column) > tuple_(after, after_id), column.is_(None)),
+                    )
+
+        try:
+            result = await session.execute(statement)
+            items = result.scalars().all()
+        except SQLAlchemyError as exception:
+            raise exception
+
+        if len(items) <= limit:
+            return Page(items, None)
+        items = items[:limit]
+        return Page(items, self._encode_cursor(items[-1], order_by))
+
+    @staticmethod
+    def _encode_cursor(row: Any, order_by: str) -> str:
+        key: list[Any] = [row.id]
+        if order_by == "created_at":
+            key = [row.created_at.isoformat() if row.created_at is not None else None, row.id]
+        return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str, order_by: str) -> list[Any]:
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if order_by == "created_at":
+                return [datetime.fromisoformat(key[0]) if key[0] is not None else None, int(key[1])]
+            return [int(key[0])]
+        except (ValueError, TypeError, IndexError) as exception:
+            raise ValueError("Invalid pagination cursor") from exception
+
     @inject_session
     async def update(
         self,
@@ -61,19 +235,152 @@ class BaseDAO(Generic[T]):
                 )
             )
             result = await session.execute(statement)
-            await session.commit()
-            return result.scalars().first()
+            db_obj = result.scalars().first()
         except SQLAlchemyError as exception:
-            await session.rollback()
             raise exception
+        if db_obj is not None:
+            await self._invalidate([db_obj])
+        return db_obj
 
     @inject_session
     async def delete(self, unique_id: int, session: AsyncSession) -> bool:
         try:
-            statement = delete(self.model).where(self.model.id == unique_id)  # type: ignore
-            result = await session.execute(statement)
-            await session.commit()
-            return result.rowcount > 0  # noqa
+            statement = delete(self.model).where(self.model.id == unique_id).returning(self.model)  # type: ignore
+            result = await session.scalars(statement)
+            deleted = result.all()
+        except SQLAlchemyError as exception:
+            raise exception
+        await self._invalidate(deleted)
+        return len(deleted) > 0
+
+    @inject_session
+    async def create_many(self, objs_in: Sequence[dict[Any, Any]], session: AsyncSession) -> Sequence[T]:
+        """
+        Insert many rows with a batched INSERT ... RETURNING.
+
+        :param objs_in: column values of each row.
+        :return: created rows.
+        """
+        if not objs_in:
+            return []
+        try:
+            statement = insert(self.model).returning(self.model)
+            result = await session.scalars(statement, list(objs_in))
+            return result.all()
+        except SQLAlchemyError as exception:
+            raise exception
+
+    @inject_session
+    async def update_many(
+        self,
+        obj_in: dict[Any, Any],
+        session: AsyncSession,
+        unique_ids: Optional[Sequence[int]] = None,
+        where: Optional[ColumnElement[bool]] = None,
+    ) -> Sequence[T]:
+        """
+        Apply the same values to every row matching the ids and/or predicate.
+
+        :param obj_in: column values to set.
+        :param unique_ids: ids of the rows to update.
+        :param where: extra predicate selecting the rows to update.
+        :return: updated rows.
+        """
+        statement = update(self.model).values(**obj_in).returning(self.model)
+        statement = statement.where(self._bulk_criteria(unique_ids, where))
+        try:
+            result = await session.scalars(statement)
+            updated = result.all()
+        except SQLAlchemyError as exception:
+            raise exception
+        await self._invalidate(updated)
+        return updated
+
+    @inject_session
+    async def delete_many(
+        self,
+        session: AsyncSession,
+        unique_ids: Optional[Sequence[int]] = None,
+        where: Optional[ColumnElement[bool]] = None,
+    ) -> int:
+        """
+        Delete every row matching the ids and/or predicate in one statement.
+
+        :param unique_ids: ids of the rows to delete.
+        :param where: extra predicate selecting the rows to delete.
+        :return: number of deleted rows.
+        """
+        statement = delete(self.model).where(self._bulk_criteria(unique_ids, where)).returning(self.model)
+        try:
+            result = await session.scalars(statement)
+            deleted = result.all()
+        except SQLAlchemyError as exception:
+            raise exception
+        await self._invalidate(deleted)
+        return len(deleted)
+
+    async def upsert(self, obj_in: dict[Any, Any], update_fields: Optional[Sequence[str]] = None) -> T:
+        """
+        Insert a row or update the existing one colliding on ``conflict_keys``.
+
+        :param obj_in: column values of the row.
+        :param update_fields: columns to overwrite on conflict.
+        :return: inserted or updated row.
+        """
+        rows = await self.upsert_many([obj_in], update_fields=update_fields)  # type: ignore
+        return rows[0]
+
+    @inject_session
+    async def upsert_many(
+        self,
+        objs_in: Sequence[dict[Any, Any]],
+        session: AsyncSession,
+        update_fields: Optional[Sequence[str]] = None,
+    ) -> Sequence[T]:
+        """
+        Insert rows, updating the existing ones that collide on ``conflict_keys``.
+
+        :param objs_in: column values of each row.
+        :param update_fields: columns to overwrite on conflict, defaults to every
+            provided column except the conflict keys.
+        :return: inserted or updated rows.
+        """
+        if not objs_in:
+            return []
+
+        statement = pg_insert(self.model)
+        if update_fields is None:
+            update_fields = [name for name in objs_in[0] if name not in self.conflict_keys]
+        set_: dict[str, ColumnElement[Any]] = {
+            name: statement.excluded[name] for name in update_fields or self.conflict_keys
+        }
+        if hasattr(self.model, "updated_at"):
+            set_["updated_at"] = func.now()
+
+        statement = statement.on_conflict_do_update(index_elements=list(self.conflict_keys), set_=set_)
+        try:
+            result = await session.scalars(
+                statement.returning(self.model),
+                list(objs_in),
+                execution_options={"populate_existing": True},
+            )
+            rows = result.all()
         except SQLAlchemyError as exception:
-            await session.rollback()
             raise exception
+        await self._invalidate(rows)
+        return rows
+
+    def _bulk_criteria(
+        self,
+        unique_ids: Optional[Sequence[int]],
+        where: Optional[ColumnElement[bool]],
+    ) -> ColumnElement[bool]:
+        if unique_ids is None and where is None:
+            raise ValueError("Bulk operations require unique_ids or a where clause")
+
+        criteria = []
+        if unique_ids is not None:
+            criteria.append(self.model.id.in_([int(unique_id) for unique_id in unique_ids]))  # type: ignore
+        if where is not None:
+            criteria.append(where)
+        return and_(*criteria)
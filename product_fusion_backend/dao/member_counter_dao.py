@@ -0,0 +1,40 @@
+from typing import Any
+
+from sqlalchemy import CursorResult, delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from product_fusion_backend.connections import inject_session
+from product_fusion_backend.dao.base_dao import BaseDAO
+from product_fusion_backend.models import MemberModel
+from product_fusion_backend.models.member_counter_model import MemberCounterModel
+
+
+class MemberCounterDAO(BaseDAO[MemberCounterModel]):
+    conflict_keys = ("org_id", "role_id", "status")
+
+    def __init__(self) -> None:
+        super().__init__(MemberCounterModel)
+
+    @inject_session
+    async def rebuild(self, session: AsyncSession) -> int:
+        """
+        Recompute every counter from the member table.
+
+        Writes to member are blocked until the transaction commits, so the
+        trigger cannot interleave with the recount.
+
+        :return: number of counter rows written.
+        """
+        if session.get_bind().dialect.name == "postgresql":
+            await session.execute(text("LOCK TABLE member IN SHARE ROW EXCLUSIVE MODE"))
+        await session.execute(delete(self.model))
+
+        counts = select(
+            MemberModel.org_id,
+            MemberModel.role_id,
+            MemberModel.status,
+            func.count(),
+        ).group_by(MemberModel.org_id, MemberModel.role_id, MemberModel.status)
+        statement = insert(self.model).from_select(["org_id", "role_id", "status", "count"], counts)
+        result: CursorResult[Any] = await session.execute(statement)
+        return result.rowcount
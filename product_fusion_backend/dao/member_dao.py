@@ -1,38 +1,100 @@
-from typing import Optional
+import hmac
+from typing import Any, NamedTuple, Optional, Sequence, Type
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import ColumnElement, and_, exists, func, null, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from product_fusion_backend.connections import inject_session
-from product_fusion_backend.dao.base_dao import BaseDAO
+from product_fusion_backend.core.cache import cached
+from product_fusion_backend.core.utils.signed_token import signed_tokens
+from product_fusion_backend.dao.base_dao import BaseDAO, P
+from product_fusion_backend.dao.role_dao import RoleDAO
+from product_fusion_backend.dao.user_dao import UserDAO
+from product_fusion_backend.models import OrganizationModel, RoleModel
 from product_fusion_backend.models.member_model import MemberModel
 
 
+class MemberRef(NamedTuple):
+    id: int
+    user_id: int
+    org_id: int
+    role_id: int
+    status: int
+
+
+class MemberAuthorization(NamedTuple):
+    """Everything a member management endpoint checks before acting."""
+
+    organization_exists: bool
+    target_member_role: Optional[str]
+    target_role: Optional[str]
+    owner_count: int
+
+
 class MemberDAO(BaseDAO[MemberModel]):
+    conflict_keys = ("user_id", "org_id")
+
     def __init__(self) -> None:
         super().__init__(MemberModel)
 
+    def cache_keys(self, obj: MemberModel) -> list[str]:
+        return [
+            *super().cache_keys(obj),
+            self.cache_key("_get_by_user_and_org", obj.user_id, obj.org_id),
+            UserDAO().cache_key("get_principal", obj.user_id),
+        ]
+
+    # New memberships change the cached principal of their user.
+    async def create(self, obj_in: dict[Any, Any]) -> MemberModel:  # type: ignore[override]
+        member = await super().create(obj_in)  # type: ignore
+        await self._invalidate([member])
+        return member
+
+    async def create_many(self, objs_in: Sequence[dict[Any, Any]]) -> Sequence[MemberModel]:  # type: ignore[override]
+        members = await super().create_many(objs_in)  # type: ignore
+        await self._invalidate(members)
+        return members
+
+    async def get_by_user_and_org(self, user_id: int, org_id: int) -> Optional[MemberModel]:
+        """
+        Load the membership of a user in an organization, with its role.
+
+        The member row and the role are cached under their own keys, so role
+        writes, which only invalidate the role's key, are seen here as well.
+        """
+        member = await self._get_by_user_and_org(user_id, org_id)  # type: ignore
+        if member is not None:
+            set_committed_value(member, "role", await RoleDAO().get(member.role_id))  # type: ignore
+        return member
+
+    @cached()
     @inject_session
-    async def get_by_user_and_org(
+    async def _get_by_user_and_org(
         self,
         user_id: int,
         org_id: int,
         session: AsyncSession,
     ) -> Optional[MemberModel]:
-        statement = (
-            select(self.model)
-            .options(selectinload(self.model.role))
-            .where(
-                and_(
-                    (self.model.user_id == int(user_id)),
-                    (self.model.org_id == int(org_id)),
-                ),
-            )
+        statement = select(self.model).where(
+            and_(
+                (self.model.user_id == int(user_id)),
+                (self.model.org_id == int(org_id)),
+            ),
         )
         result = await session.execute(statement)
         return result.scalars().first()
 
+    async def get_projection_by_user_and_org(self, user_id: int, org_id: int, projection: Type[P]) -> Optional[P]:
+        rows = await self.get_projections(  # type: ignore
+            projection,
+            self.model.user_id == int(user_id),  # noqa
+            self.model.org_id == int(org_id),  # noqa
+            limit=1,
+        )
+        return rows[0] if rows else None
+
     @inject_session
     async def get_user_with_role(
         self,
@@ -52,6 +114,22 @@ class MemberDAO(BaseDAO[MemberModel]):
     @inject_session
     async def get_by_invite_token(self, token: str, session: AsyncSession) -> Optional[MemberModel]:
         token = token.strip()
+        if signed_tokens.is_signed(token):
+            payload = signed_tokens.verify(token, "invite_token")
+            if payload is None:
+                return None
+            statement = (
+                select(self.model)
+                .options(selectinload(self.model.role))
+                .where(self.model.id == payload.subject_id)  # noqa
+            )
+            result = await session.execute(statement)
+            member = result.scalars().first()
+            stored_nonce = ((member.settings or {}).get("invite_token") or {}).get("token") if member else None
+            if not stored_nonce or not hmac.compare_digest(str(stored_nonce), payload.nonce):
+                return None
+            return member
+
         statement = (
             select(self.model)
             .options(selectinload(self.model.role))
@@ -60,6 +138,62 @@ class MemberDAO(BaseDAO[MemberModel]):
         result = await session.execute(statement)
         return result.scalars().first()
 
+    @inject_session
+    async def get_authorization_context(
+        self,
+        org_id: int,
+        session: AsyncSession,
+        target_member_id: Optional[int] = None,
+        target_role_id: Optional[int] = None,
+    ) -> MemberAuthorization:
+        """
+        Load the checks of a member management action in one round trip.
+
+        :param org_id: organization the action applies to.
+        :param target_member_id: member being changed, if any.
+        :param target_role_id: role being assigned, if any.
+        :return: target member's role and assigned role name,
+            each ``None`` when not found in the organization, plus the owner count.
+        """
+        member = self.model
+        organization_exists = exists().where(OrganizationModel.id == int(org_id))
+        target_member_role: ColumnElement[Any] = null()
+        if target_member_id is not None:
+            target_member_role = (
+                select(RoleModel.name)
+                .join(member, member.role_id == RoleModel.id)
+                .where(member.id == int(target_member_id), member.org_id == int(org_id))
+                .scalar_subquery()
+            )
+        target_role: ColumnElement[Any] = null()
+        if target_role_id is not None:
+            target_role = (
+                select(RoleModel.name)
+                .where(RoleModel.id == int(target_role_id), RoleModel.org_id == int(org_id))
+                .scalar_subquery()
+            )
+        owner_count = (
+            select(func.count())
+            .select_from(member)
+            .join(RoleModel, member.role_id == RoleModel.id)
+            .where(member.org_id == int(org_id), RoleModel.name == "owner")
+            .scalar_subquery()
+        )
+
+        statement = select(
+            organization_exists.label("organization_exists"),
+            target_member_role.label("target_member_role"),
+            target_role.label("target_role"),
+            owner_count.label("owner_count"),
+        )
+        row = (await session.execute(statement)).one()
+        return MemberAuthorization(
+            organization_exists=bool(row.organization_exists),
+            target_member_role=row.target_member_role,
+            target_role=row.target_role,
+            owner_count=row.owner_count,
+        )
+
     @inject_session
     async def count_by_role_in_org(self, role_name: str, org_id: int, session: AsyncSession) -> int:
         statement = (
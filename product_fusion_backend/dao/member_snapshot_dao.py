@@ -0,0 +1,40 @@
+from typing import Any
+
+from sqlalchemy import CursorResult, delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from product_fusion_backend.connections import inject_session
+from product_fusion_backend.dao.base_dao import BaseDAO
+from product_fusion_backend.models import MemberDailySnapshotModel, MemberModel
+
+
+class MemberSnapshotDAO(BaseDAO[MemberDailySnapshotModel]):
+    conflict_keys = ("day", "org_id", "role_id", "status")
+
+    def __init__(self) -> None:
+        super().__init__(MemberDailySnapshotModel)
+
+    @inject_session
+    async def rebuild(self, session: AsyncSession) -> int:
+        """
+        Recompute every daily snapshot from the member table.
+
+        Writes to member are blocked until the transaction commits, so the
+        trigger cannot interleave with the recount. Days are bucketed by the
+        database, the same way the trigger does.
+
+        :return: number of snapshot rows written.
+        """
+        if session.get_bind().dialect.name == "postgresql":
+            await session.execute(text("LOCK TABLE member IN SHARE ROW EXCLUSIVE MODE"))
+        await session.execute(delete(self.model))
+
+        day = func.date(MemberModel.created_at)
+        counts = (
+            select(day, MemberModel.org_id, MemberModel.role_id, MemberModel.status, func.count())
+            .where(MemberModel.created_at.is_not(None))
+            .group_by(day, MemberModel.org_id, MemberModel.role_id, MemberModel.status)
+        )
+        statement = insert(self.model).from_select(["day", "org_id", "role_id", "status", "count"], counts)
+        result: CursorResult[Any] = await session.execute(statement)
+        return result.rowcount
@@ -1,17 +1,19 @@
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 from typing import Any, Optional
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import func, literal, or_, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
 from product_fusion_backend.connections import inject_session
 from product_fusion_backend.dao.base_dao import BaseDAO
-from product_fusion_backend.models import MemberModel, RoleModel, UserModel
+from product_fusion_backend.models import MemberCounterModel, MemberDailySnapshotModel, MemberModel, RoleModel
 from product_fusion_backend.models.organization_model import OrganizationModel
 
 
 class OrganizationDAO(BaseDAO[OrganizationModel]):
+    conflict_keys = ("name",)
+
     def __init__(self) -> None:
         super().__init__(OrganizationModel)
 
@@ -23,21 +25,25 @@ class OrganizationDAO(BaseDAO[OrganizationModel]):
         result = await session.execute(statement)
         return result.scalars().first()
 
-    @inject_session
+    @inject_session(read_only=True)
     async def get_organization_wise_member_count(self, session: AsyncSession) -> list[dict[str, Any]]:
-        member = aliased(MemberModel)
+        # A user is a member of an organization at most once, so summing the
+        # counters equals counting distinct users.
+        counter = aliased(MemberCounterModel)
+        member_count = func.sum(counter.count)
         statement = (
             select(
                 self.model.name.label("organization"),
-                func.count(member.user_id.distinct()).label("member_count"),  # noqa
+                member_count.label("member_count"),
             )
-            .join(member, self.model.id == member.org_id)  # noqa
+            .join(counter, self.model.id == counter.org_id)  # noqa
             .group_by(self.model.name)
+            .having(member_count > 0)
         )
         result = await session.execute(statement)
         return [{"organization": row.organization, "member_count": row.member_count} for row in result]
 
-    @inject_session
+    @inject_session(read_only=True)
     async def get_organization_role_wise_user_count(
         self,
         from_date: Optional[datetime],
@@ -45,33 +51,93 @@ class OrganizationDAO(BaseDAO[OrganizationModel]):
         status: Optional[int],
         session: AsyncSession,
     ) -> list[dict[str, Any]]:
-        role = aliased(RoleModel)
-        member = aliased(MemberModel)
-        user = aliased(UserModel)
+        if from_date or to_date:
+            return await self._count_organization_role_wise_users(from_date, to_date, status, session)
 
+        role = aliased(RoleModel)
+        counter = aliased(MemberCounterModel)
+        user_count = func.sum(counter.count)
         statement = (
             select(
                 self.model.name.label("organization"),
                 role.name.label("role"),  # noqa
-                func.count(member.user_id.distinct()).label("user_count"),  # noqa
+                user_count.label("user_count"),
             )
-            .join(member, self.model.id == member.org_id)  # noqa
-            .join(role, member.role_id == role.id)
-            .join(user, member.user_id == user.id)
+            .join(counter, self.model.id == counter.org_id)  # noqa
+            .join(role, counter.role_id == role.id)
         )
+        if status is not None:
+            statement = statement.where(counter.status == status)
+        statement = statement.group_by(self.model.name, role.name).having(user_count > 0)
 
-        conditions = []
+        result = await session.execute(statement)
+        return [
+            {
+                "organization": row.organization,
+                "role": row.role,
+                "user_count": row.user_count,
+            }
+            for row in result
+        ]
+
+    async def _count_organization_role_wise_users(
+        self,
+        from_date: Optional[datetime],
+        to_date: Optional[datetime],
+        status: Optional[int],
+        session: AsyncSession,
+    ) -> list[dict[str, Any]]:
+        # Whole days of the range are read from the trigger-maintained daily
+        # snapshots; only the partial days at both ends are counted from
+        # member. Counting member rows equals counting distinct users because
+        # (user_id, org_id) is unique.
+        snapshot = aliased(MemberDailySnapshotModel)
+        member = aliased(MemberModel)
+        role = aliased(RoleModel)
+
+        first_day, end_day = self._snapshot_range(from_date, to_date)
+
+        member_conditions = []
         if from_date:
-            conditions.append(member.created_at >= from_date)
+            member_conditions.append(member.created_at >= from_date)
         if to_date:
-            conditions.append(member.created_at <= to_date)
+            member_conditions.append(member.created_at <= to_date)
         if status is not None:
-            conditions.append(member.status == status)
+            member_conditions.append(member.status == status)
 
-        if conditions:
-            statement = statement.where(and_(*conditions))
+        parts = []
+        if first_day is not None or end_day is not None:
+            snapshot_conditions = []
+            outside_snapshots = []
+            if first_day is not None:
+                snapshot_conditions.append(snapshot.day >= first_day)
+                outside_snapshots.append(member.created_at < datetime.combine(first_day, time.min))
+            if end_day is not None:
+                snapshot_conditions.append(snapshot.day < end_day)
+                outside_snapshots.append(member.created_at >= datetime.combine(end_day, time.min))
+            if status is not None:
+                snapshot_conditions.append(snapshot.status == status)
+            member_conditions.append(or_(*outside_snapshots))
+            parts.append(
+                select(snapshot.org_id, snapshot.role_id, snapshot.count.label("user_count")).where(
+                    *snapshot_conditions,
+                ),
+            )
+        parts.append(select(member.org_id, member.role_id, literal(1).label("user_count")).where(*member_conditions))
+        counts = union_all(*parts).subquery()
 
-        statement = statement.group_by(self.model.name, role.name)
+        user_count = func.sum(counts.c.user_count)
+        statement = (
+            select(
+                self.model.name.label("organization"),
+                role.name.label("role"),  # noqa
+                user_count.label("user_count"),
+            )
+            .join(counts, self.model.id == counts.c.org_id)  # noqa
+            .join(role, counts.c.role_id == role.id)
+            .group_by(self.model.name, role.name)
+            .having(user_count > 0)
+        )
 
         result = await session.execute(statement)
         return [
@@ -82,3 +148,26 @@ class OrganizationDAO(BaseDAO[OrganizationModel]):
             }
             for row in result
         ]
+
+    @staticmethod
+    def _snapshot_range(
+        from_date: Optional[datetime],
+        to_date: Optional[datetime],
+    ) -> tuple[Optional[date], Optional[date]]:
+        """
+        Whole days of the range that can be answered from snapshots.
+
+        :return: first day and exclusive end day, ``None`` meaning unbounded,
+            or ``(None, None)`` when the range covers no whole day.
+        """
+        first_day = None
+        if from_date is not None:
+            first_day = from_date.date()
+            if from_date.time() != time.min:
+                first_day += timedelta(days=1)
+
+        end_day = to_date.date() if to_date is not None else None
+
+        if first_day is not None and end_day is not None and end_day <= first_day:
+            return None, None
+        return first_day, end_day
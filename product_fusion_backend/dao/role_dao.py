@@ -11,6 +11,8 @@ from product_fusion_backend.models.role_model import RoleModel
 
 
 class RoleDAO(BaseDAO[RoleModel]):
+    conflict_keys = ("org_id", "name")
+
     def __init__(self) -> None:
         super().__init__(RoleModel)
 
@@ -23,8 +25,25 @@ class RoleDAO(BaseDAO[RoleModel]):
         result = await session.execute(statement)
         return result.scalars().first()
 
+    @inject_session(read_only=True)
+    async def get_permission_masks(self, session: AsyncSession) -> list[tuple[int, int, int]]:
+        statement = select(self.model.org_id, self.model.id, self.model.permissions)
+        result = await session.execute(statement)
+        return [(row.org_id, row.id, row.permissions) for row in result]
+
     @inject_session
+    async def get_permission_mask(self, org_id: int, role_id: int, session: AsyncSession) -> Optional[int]:
+        statement = select(self.model.permissions).where(
+            self.model.id == role_id,  # noqa
+            self.model.org_id == org_id,  # noqa
+        )
+        result = await session.execute(statement)
+        return result.scalar_one_or_none()
+
+    @inject_session(read_only=True)
     async def get_role_wise_user_count(self, session: AsyncSession) -> list[dict[str, Any]]:
+        # Role names repeat across organizations and a user counted once per
+        # name here may hold it in several, so member_counter can't answer this.
         member = aliased(MemberModel)
         statement = (
             select(
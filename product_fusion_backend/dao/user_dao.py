@@ -1,17 +1,213 @@
-from typing import Optional
+import hmac
+import json
+from typing import Any, NamedTuple, Optional, Type
 
-from sqlalchemy import select
+from sqlalchemy import literal, null, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from product_fusion_backend.connections import inject_session
-from product_fusion_backend.dao.base_dao import BaseDAO
+from product_fusion_backend.connections import database, inject_session
+from product_fusion_backend.core.cache import dao_cache
+from product_fusion_backend.core.utils.enums import ROLE_PERMISSIONS
+from product_fusion_backend.core.utils.signed_token import signed_tokens
+from product_fusion_backend.dao.base_dao import BaseDAO, P
+from product_fusion_backend.models import MemberModel, OrganizationModel, RoleModel
 from product_fusion_backend.models.user_model import UserModel
+from product_fusion_backend.settings import settings
+
+
+class UserRef(NamedTuple):
+    id: int
+    email: str
+
+
+class UserCredentials(NamedTuple):
+    id: int
+    email: str
+    password: str
+
+
+class Membership(NamedTuple):
+    member_id: int
+    org_id: int
+    role_id: int
+    status: int
+
+
+class Principal(NamedTuple):
+    """The authenticated user and all of their organization memberships."""
+
+    user_id: int
+    email: str
+    status: int
+    memberships: dict[int, Membership]
+
+    def membership(self, org_id: int) -> Optional[Membership]:
+        return self.memberships.get(int(org_id))
+
+    def role_id(self, org_id: int) -> Optional[int]:
+        membership = self.membership(org_id)
+        return membership.role_id if membership is not None else None
+
+    def dumps(self) -> str:
+        return json.dumps([self.user_id, self.email, self.status, list(self.memberships.values())])
+
+    @classmethod
+    def loads(cls, data: str) -> "Principal":
+        user_id, email, status, memberships = json.loads(data)
+        return cls(user_id, email, status, {row[1]: Membership(*row) for row in memberships})
 
 
 class UserDAO(BaseDAO[UserModel]):
+    conflict_keys = ("email",)
+    # Rows hold the password hash and the reset and verification tokens,
+    # which must not be readable by anything with access to Redis.
+    cacheable = False
+
     def __init__(self) -> None:
         super().__init__(UserModel)
 
+    def cache_keys(self, obj: UserModel) -> list[str]:
+        return [*super().cache_keys(obj), self.cache_key("get_principal", obj.id)]
+
+    @inject_session
+    async def create_with_organization(
+        self,
+        user_in: dict[str, Any],
+        org_in: dict[str, Any],
+        session: AsyncSession,
+    ) -> Optional[int]:
+        """
+        Create a user as owner of an organization in a single statement.
+
+        The user, the organization and its owner role are inserted with
+        ON CONFLICT, so concurrent signups for the same organization name
+        converge on one organization and one owner role instead of racing
+        between a lookup and an insert. Nothing is written when the email is
+        already registered.
+
+        :param user_in: column values of the user.
+        :param org_in: column values of the organization, used when it doesn't exist yet.
+        :return: id of the new user, or ``None`` when the email is taken.
+        """
+        # A None bound to a JSON column is stored as JSON null, so unset values
+        # are written as SQL NULL explicitly. Omitting them instead would need
+        # the client-side column defaults, which can't be rendered in a CTE.
+        user_in = {column: null() if value is None else value for column, value in user_in.items()}
+
+        new_user = (
+            pg_insert(self.model)
+            .values(**user_in)
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(self.model.id)
+            .cte("new_user")
+        )
+
+        # The no-op DO UPDATE makes RETURNING yield the existing row as well.
+        org_columns = list(org_in)
+        org_table = OrganizationModel.__table__
+        org_insert = pg_insert(OrganizationModel).from_select(
+            org_columns,
+            select(
+                *(
+                    null() if org_in[column] is None else literal(org_in[column], org_table.c[column].type)
+                    for column in org_columns
+                ),
+            ).select_from(new_user),
+        )
+        org = (
+            org_insert.on_conflict_do_update(index_elements=["name"], set_={"name": org_insert.excluded.name})
+            .returning(OrganizationModel.id)
+            .cte("org")
+        )
+
+        role_insert = pg_insert(RoleModel).from_select(
+            ["name", "org_id", "description", "permissions"],
+            select(
+                literal("owner"),
+                org.c.id,
+                literal("Owner of the organization"),
+                literal(int(ROLE_PERMISSIONS["owner"])),
+            ),
+        )
+        role = (
+            role_insert.on_conflict_do_update(
+                index_elements=["org_id", "name"],
+                set_={"name": role_insert.excluded.name},
+            )
+            .returning(RoleModel.id, RoleModel.org_id)
+            .cte("owner_role")
+        )
+
+        member = (
+            pg_insert(MemberModel)
+            .from_select(
+                ["user_id", "org_id", "role_id", "status"],
+                select(new_user.c.id, role.c.org_id, role.c.id, literal(1)),
+            )
+            .returning(MemberModel.id)
+            .cte("new_member")
+        )
+
+        user_id = await session.scalar(select(new_user.c.id).add_cte(member))
+        # The statement is a SELECT over INSERT CTEs and nothing is flushed, so
+        # the unit of work can't tell it wrote: without this, later reads in
+        # the request could go to a replica or the cache and miss these rows.
+        uow = database.current_unit_of_work()
+        if uow is not None:
+            uow.has_writes = True
+        return user_id
+
+    async def get_principal(self, user_id: int) -> Optional[Principal]:
+        """
+        Load a user with all of their memberships, through the shared cache.
+
+        Cached for ``PRINCIPAL_CACHE_TTL_SECONDS`` and dropped whenever the user
+        or one of their memberships is written.
+
+        :param user_id: user to load.
+        :return: the principal, ``None`` if the user does not exist.
+        """
+        key = self.cache_key("get_principal", int(user_id))
+        uow = database.current_unit_of_work()
+        use_cache = dao_cache.enabled and (uow is None or not uow.has_writes)
+        if use_cache:
+            data = await dao_cache.get(key)
+            if data is not None:
+                return Principal.loads(data)
+
+        principal = await self._load_principal(int(user_id))  # type: ignore
+        if principal is not None and use_cache:
+            await dao_cache.set(key, principal.dumps(), ttl=settings.principal_cache_ttl_seconds)
+        return principal
+
+    @inject_session
+    async def _load_principal(self, user_id: int, session: AsyncSession) -> Optional[Principal]:
+        # Read from the primary: a lagging replica could cache a membership
+        # that was just removed for the whole TTL.
+        statement = (
+            select(
+                self.model.id,
+                self.model.email,
+                self.model.status,
+                MemberModel.id.label("member_id"),
+                MemberModel.org_id,
+                MemberModel.role_id,
+                MemberModel.status.label("member_status"),
+            )
+            .outerjoin(MemberModel, MemberModel.user_id == self.model.id)  # noqa
+            .where(self.model.id == user_id)  # noqa
+        )
+        rows = (await session.execute(statement)).all()
+        if not rows:
+            return None
+        memberships = {
+            row.org_id: Membership(row.member_id, row.org_id, row.role_id, row.member_status)
+            for row in rows
+            if row.member_id is not None
+        }
+        return Principal(rows[0].id, rows[0].email, rows[0].status, memberships)
+
     @inject_session
     async def get_by_email(self, email: str, session: AsyncSession) -> Optional[UserModel]:
         statement = select(self.model).where(
@@ -20,9 +216,15 @@ class UserDAO(BaseDAO[UserModel]):
         result = await session.execute(statement)
         return result.scalars().first()
 
+    async def get_projection_by_email(self, email: str, projection: Type[P]) -> Optional[P]:
+        rows = await self.get_projections(projection, self.model.email == email, limit=1)  # type: ignore
+        return rows[0] if rows else None
+
     @inject_session
     async def get_by_reset_token(self, token: str, session: AsyncSession) -> Optional[UserModel]:
         token = token.strip()
+        if signed_tokens.is_signed(token):
+            return await self._get_by_signed_token(token, "reset_token", session)
         statement = select(self.model).where(
             (self.model.settings["reset_token"].op("->>")("token") == token),  # noqa
         )
@@ -31,8 +233,22 @@ class UserDAO(BaseDAO[UserModel]):
 
     @inject_session
     async def get_by_verification_token(self, token: str, session: AsyncSession) -> Optional[UserModel]:
+        if signed_tokens.is_signed(token):
+            return await self._get_by_signed_token(token, "email_verification", session)
         statement = select(self.model).where(
             self.model.settings["email_verification"].op("->>")("token") == token,  # noqa
         )
         result = await session.execute(statement)
         return result.scalars().first()
+
+    async def _get_by_signed_token(self, token: str, purpose: str, session: AsyncSession) -> Optional[UserModel]:
+        payload = signed_tokens.verify(token, purpose)
+        if payload is None:
+            return None
+        statement = select(self.model).where(self.model.id == payload.subject_id)  # noqa
+        result = await session.execute(statement)
+        user = result.scalars().first()
+        stored_nonce = ((user.settings or {}).get(purpose) or {}).get("token") if user else None
+        if not stored_nonce or not hmac.compare_digest(str(stored_nonce), payload.nonce):
+            return None
+        return user
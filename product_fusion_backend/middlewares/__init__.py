@@ -1,7 +1,9 @@
 from product_fusion_backend.middlewares.auth_middleware import JWTAuthMiddleware
 from product_fusion_backend.middlewares.logging_middleware import LoggingMiddleware
+from product_fusion_backend.middlewares.unit_of_work_middleware import UnitOfWorkMiddleware
 
 __all__ = [
     "LoggingMiddleware",
     "JWTAuthMiddleware",
+    "UnitOfWorkMiddleware",
 ]
@@ -1,39 +1,55 @@
 from authlib.jose import JoseError, jwt
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from product_fusion_backend.core import SKIP_URLS, APIResponse, StatusEnum
+from product_fusion_backend.core.utils.token_cache import token_cache
 from product_fusion_backend.settings import settings
 
 
-class JWTAuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.url.path in SKIP_URLS:
-            return await call_next(request)
+class JWTAuthMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        auth_header = request.headers.get("Authorization")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in SKIP_URLS:
+            await self.app(scope, receive, send)
+            return
+
+        auth_header = Headers(scope=scope).get("Authorization")
         if not auth_header:
-            return APIResponse(
+            response = APIResponse(
                 status_code=401,
                 message="Authorization header is required",
                 status_=StatusEnum.ERROR,
             )
+            await response(scope, receive, send)
+            return
 
         try:
             scheme, token = auth_header.split()
             if scheme.lower() != "bearer":
-                return APIResponse(
+                response = APIResponse(
                     status_code=401,
                     message="Invalid token type",
                     status_=StatusEnum.ERROR,
                 )
-            payload = jwt.decode(token, settings.secret_key)
-            request.state.user_id = payload.get("sub")
+                await response(scope, receive, send)
+                return
+            payload = token_cache.get(token)
+            if payload is None:
+                claims = jwt.decode(token, settings.secret_key)
+                claims.validate()
+                token_cache.set(token, claims)
+                payload = claims
+            scope.setdefault("state", {})["user_id"] = payload.get("sub")
         except (ValueError, JoseError):
-            return APIResponse(
+            response = APIResponse(
                 status_code=401,
                 message="Invalid token",
                 status_=StatusEnum.ERROR,
             )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -1,20 +1,27 @@
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from product_fusion_backend.core import end_stage_logger, stage_logger
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:  # type: ignore
-        if request.client:
-            stage_logger.info(
-                f'{request.client.host}:{request.client.port} - "{request.method} {request.url.path} '
-                f'{request.scope['http_version']}"',
-            )
-        response = await call_next(request)
-        if request.client:
-            end_stage_logger.info(
-                f'{request.client.host}:{request.client.port} - "{request.method} {request.url.path} '
-                f'{request.scope['http_version']}" {response.status_code}',
-            )
-        return response
+class LoggingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        client = scope.get("client")
+        if scope["type"] != "http" or not client:
+            await self.app(scope, receive, send)
+            return
+
+        request_line = f'{client[0]}:{client[1]} - "{scope["method"]} {scope["path"]} {scope["http_version"]}"'
+        stage_logger.info(request_line)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        end_stage_logger.info(f"{request_line} {status_code}")
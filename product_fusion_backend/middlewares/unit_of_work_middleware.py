@@ -0,0 +1,36 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from product_fusion_backend.connections import database
+
+
+class UnitOfWorkMiddleware:
+    """
+    Runs every request inside a single unit of work.
+
+    All DAO calls made while handling the request share one session. It is
+    committed when the response is successful and rolled back for error
+    responses, so multi-step flows are applied atomically. The outcome is
+    settled before the response starts, so clients never see a success for
+    a transaction that failed to commit. Work done after an error response
+    has started, such as background tasks, is discarded with the rest.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with database.unit_of_work() as uow:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    if message["status"] >= 400:
+                        await uow.rollback()
+                    else:
+                        await uow.commit()
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
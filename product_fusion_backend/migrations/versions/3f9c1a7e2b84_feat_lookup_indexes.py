@@ -0,0 +1,33 @@
+"""feat(db): Indexes for hot lookup paths
+
+Revision ID: 3f9c1a7e2b84
+Revises: 6b7694a5d624
+Create Date: 2026-10-18 10:45:12.418305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c1a7e2b84"
+down_revision: Union[str, None] = "6b7694a5d624"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_member_user_id_org_id", "member", ["user_id", "org_id"], unique=True)
+    op.create_index("ix_member_org_id_role_id", "member", ["org_id", "role_id"], unique=False)
+    op.create_index("ix_member_created_at", "member", ["created_at"], unique=False)
+    op.create_index("ix_role_org_id_name", "role", ["org_id", "name"], unique=True)
+    op.create_index("ix_organization_name", "organization", ["name"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_organization_name", table_name="organization")
+    op.drop_index("ix_role_org_id_name", table_name="role")
+    op.drop_index("ix_member_created_at", table_name="member")
+    op.drop_index("ix_member_org_id_role_id", table_name="member")
+    op.drop_index("ix_member_user_id_org_id", table_name="member")
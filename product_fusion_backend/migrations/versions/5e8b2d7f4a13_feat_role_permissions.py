@@ -0,0 +1,44 @@
+"""feat(auth): Permission bitmask on roles
+
+Revision ID: 5e8b2d7f4a13
+Revises: c41a7f3d90e2
+Create Date: 2026-10-18 14:12:45.318276
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8b2d7f4a13"
+down_revision: Union[str, None] = "c41a7f3d90e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Permission values at the time of this revision: VIEW_MEMBERS=1, INVITE_MEMBER=2,
+# REMOVE_MEMBER=4, UPDATE_MEMBER_ROLE=8, MANAGE_ROLES=16, MANAGE_ORGANIZATION=32.
+OWNER_PERMISSIONS = 63
+ADMIN_PERMISSIONS = 15
+MEMBER_PERMISSIONS = 1
+
+
+def upgrade() -> None:
+    op.add_column("role", sa.Column("permissions", sa.Integer(), server_default="0", nullable=False))
+    # Keep the access the built-in roles had through the role name checks.
+    for name, permissions in (
+        ("owner", OWNER_PERMISSIONS),
+        ("admin", ADMIN_PERMISSIONS),
+        ("member", MEMBER_PERMISSIONS),
+    ):
+        op.execute(
+            sa.text("UPDATE role SET permissions = :permissions WHERE name = :name").bindparams(
+                permissions=permissions,
+                name=name,
+            ),
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("role", "permissions")
@@ -0,0 +1,71 @@
+"""feat(stats): Membership counters maintained by trigger
+
+Revision ID: 8d2e5b1c9a47
+Revises: 3f9c1a7e2b84
+Create Date: 2026-10-18 11:02:37.104512
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2e5b1c9a47"
+down_revision: Union[str, None] = "3f9c1a7e2b84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "member_counter",
+        sa.Column("org_id", sa.Integer(), nullable=False),
+        sa.Column("role_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.Integer(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["org_id"], ["organization.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["role_id"], ["role.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("org_id", "role_id", "status"),
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION member_counter_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE member_counter SET count = count - 1
+                WHERE org_id = OLD.org_id AND role_id = OLD.role_id AND status = OLD.status;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO member_counter (org_id, role_id, status, count)
+                VALUES (NEW.org_id, NEW.role_id, NEW.status, 1)
+                ON CONFLICT (org_id, role_id, status) DO UPDATE SET count = member_counter.count + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+    )
+    # Backfill and attach the trigger while writes to member are blocked, so no
+    # row is counted twice or missed.
+    op.execute("LOCK TABLE member IN SHARE ROW EXCLUSIVE MODE")
+    op.execute(
+        """
+        INSERT INTO member_counter (org_id, role_id, status, count)
+        SELECT org_id, role_id, status, count(*) FROM member GROUP BY org_id, role_id, status
+        """,
+    )
+    op.execute(
+        """
+        CREATE TRIGGER member_counter_sync
+        AFTER INSERT OR DELETE OR UPDATE OF org_id, role_id, status ON member
+        FOR EACH ROW EXECUTE FUNCTION member_counter_apply()
+        """,
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS member_counter_sync ON member")
+    op.execute("DROP FUNCTION IF EXISTS member_counter_apply()")
+    op.drop_table("member_counter")
@@ -0,0 +1,83 @@
+"""feat(stats): Maintain daily member snapshots by trigger
+
+Revision ID: 9a4c6e1f2d58
+Revises: 5e8b2d7f4a13
+Create Date: 2026-10-18 16:40:12.902311
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4c6e1f2d58"
+down_revision: Union[str, None] = "5e8b2d7f4a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _member_timestamps_are_epochs() -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns("member")
+    return any(column["name"] == "created_at" and isinstance(column["type"], sa.BigInteger) for column in columns)
+
+
+def upgrade() -> None:
+    # The initial migration created the member timestamps as BigInteger epoch
+    # seconds, while the model, the trigger and the backfill below work with
+    # timestamps. Databases built from the models already have timestamps.
+    if _member_timestamps_are_epochs():
+        for column in ("created_at", "updated_at"):
+            op.alter_column(
+                "member",
+                column,
+                type_=sa.DateTime(),
+                existing_type=sa.BigInteger(),
+                existing_nullable=True,
+                postgresql_using=f"to_timestamp({column})::timestamp",
+            )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION member_daily_snapshot_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.created_at IS NOT NULL THEN
+                UPDATE member_daily_snapshot SET count = count - 1
+                WHERE day = date(OLD.created_at) AND org_id = OLD.org_id AND role_id = OLD.role_id
+                    AND status = OLD.status;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.created_at IS NOT NULL THEN
+                INSERT INTO member_daily_snapshot (day, org_id, role_id, status, count)
+                VALUES (date(NEW.created_at), NEW.org_id, NEW.role_id, NEW.status, 1)
+                ON CONFLICT (day, org_id, role_id, status) DO UPDATE SET count = member_daily_snapshot.count + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+    )
+    # Recount every day, including the ones rolled up before, while writes to
+    # member are blocked so no row is counted twice or missed.
+    op.execute("LOCK TABLE member IN SHARE ROW EXCLUSIVE MODE")
+    op.execute("DELETE FROM member_daily_snapshot")
+    op.execute(
+        """
+        INSERT INTO member_daily_snapshot (day, org_id, role_id, status, count)
+        SELECT date(created_at), org_id, role_id, status, count(*) FROM member
+        WHERE created_at IS NOT NULL
+        GROUP BY date(created_at), org_id, role_id, status
+        """,
+    )
+    op.execute(
+        """
+        CREATE TRIGGER member_daily_snapshot_sync
+        AFTER INSERT OR DELETE OR UPDATE OF org_id, role_id, status, created_at ON member
+        FOR EACH ROW EXECUTE FUNCTION member_daily_snapshot_apply()
+        """,
+    )
+
+
+def downgrade() -> None:
+    # The member timestamps are left as timestamps: the models need them.
+    op.execute("DROP TRIGGER IF EXISTS member_daily_snapshot_sync ON member")
+    op.execute("DROP FUNCTION IF EXISTS member_daily_snapshot_apply()")
@@ -0,0 +1,36 @@
+"""feat(stats): Daily member snapshots for date-range statistics
+
+Revision ID: c41a7f3d90e2
+Revises: 8d2e5b1c9a47
+Create Date: 2026-10-18 11:20:04.551873
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41a7f3d90e2"
+down_revision: Union[str, None] = "8d2e5b1c9a47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "member_daily_snapshot",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("org_id", sa.Integer(), nullable=False),
+        sa.Column("role_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.Integer(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["org_id"], ["organization.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["role_id"], ["role.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("day", "org_id", "role_id", "status"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("member_daily_snapshot")
@@ -0,0 +1,56 @@
+"""fix(auth): Store user and organization timestamps as timestamps
+
+Revision ID: e2d9b4c7a816
+Revises: 9a4c6e1f2d58
+Create Date: 2026-10-18 19:05:31.640219
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2d9b4c7a816"
+down_revision: Union[str, None] = "9a4c6e1f2d58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The initial migration created these as BigInteger epoch seconds, but the
+# models insert now() into them, so every signup failed on a migrated database.
+TABLES = ("user", "organization")
+COLUMNS = ("created_at", "updated_at")
+
+
+def _is_epoch(table: str) -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns(table)
+    return any(column["name"] == "created_at" and isinstance(column["type"], sa.BigInteger) for column in columns)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        if not _is_epoch(table):
+            continue
+        for column in COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(),
+                existing_type=sa.BigInteger(),
+                existing_nullable=True,
+                postgresql_using=f"to_timestamp({column})::timestamp",
+            )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        for column in COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.BigInteger(),
+                existing_type=sa.DateTime(),
+                existing_nullable=True,
+                postgresql_using=f"extract(epoch from {column})::bigint",
+            )
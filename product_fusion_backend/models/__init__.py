@@ -1,7 +1,18 @@
 from product_fusion_backend.models.base import Base, BaseModel
+from product_fusion_backend.models.member_counter_model import MemberCounterModel
+from product_fusion_backend.models.member_daily_snapshot_model import MemberDailySnapshotModel
 from product_fusion_backend.models.member_model import MemberModel
 from product_fusion_backend.models.organization_model import OrganizationModel
 from product_fusion_backend.models.role_model import RoleModel
 from product_fusion_backend.models.user_model import UserModel
 
-__all__ = ["Base", "BaseModel", "MemberModel", "OrganizationModel", "UserModel", "RoleModel"]
+__all__ = [
+    "Base",
+    "BaseModel",
+    "MemberModel",
+    "MemberCounterModel",
+    "MemberDailySnapshotModel",
+    "OrganizationModel",
+    "UserModel",
+    "RoleModel",
+]
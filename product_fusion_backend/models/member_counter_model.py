@@ -0,0 +1,64 @@
+from typing import cast
+
+from sqlalchemy import DDL, ForeignKey, Integer, Table, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from product_fusion_backend.models.base import BaseModel
+from product_fusion_backend.models.member_model import MemberModel
+
+# Keeps member_counter in step with every write to member, including bulk
+# statements and cascaded deletes, inside the writing transaction.
+MEMBER_COUNTER_FUNCTION = """
+CREATE OR REPLACE FUNCTION member_counter_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE member_counter SET count = count - 1
+        WHERE org_id = OLD.org_id AND role_id = OLD.role_id AND status = OLD.status;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO member_counter (org_id, role_id, status, count)
+        VALUES (NEW.org_id, NEW.role_id, NEW.status, 1)
+        ON CONFLICT (org_id, role_id, status) DO UPDATE SET count = member_counter.count + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Backfill and attach the trigger while writes to member are blocked, so no
+# row is counted twice or missed.
+MEMBER_COUNTER_BACKFILL = """
+INSERT INTO member_counter (org_id, role_id, status, count)
+SELECT org_id, role_id, status, count(*) FROM member GROUP BY org_id, role_id, status
+"""
+
+MEMBER_COUNTER_TRIGGER = """
+CREATE TRIGGER member_counter_sync
+AFTER INSERT OR DELETE OR UPDATE OF org_id, role_id, status ON member
+FOR EACH ROW EXECUTE FUNCTION member_counter_apply()
+"""
+
+
+class MemberCounterModel(BaseModel):
+    """Number of members per organization, role and status."""
+
+    __tablename__ = "member_counter"
+
+    org_id: Mapped[int] = mapped_column(ForeignKey("organization.id", ondelete="CASCADE"), primary_key=True)
+    role_id: Mapped[int] = mapped_column(ForeignKey("role.id", ondelete="CASCADE"), primary_key=True)
+    status: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+# Attached to member_counter rather than member, so that metadata.create_all on
+# a database whose member table already exists still backfills the counters
+# and installs the trigger, the same way migration 8d2e5b1c9a47 does.
+cast(Table, MemberCounterModel.__table__).add_is_dependent_on(cast(Table, MemberModel.__table__))
+for statement in (
+    MEMBER_COUNTER_FUNCTION,
+    "LOCK TABLE member IN SHARE ROW EXCLUSIVE MODE",
+    MEMBER_COUNTER_BACKFILL,
+    "DROP TRIGGER IF EXISTS member_counter_sync ON member",
+    MEMBER_COUNTER_TRIGGER,
+):
+    event.listen(MemberCounterModel.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
@@ -0,0 +1,69 @@
+from datetime import date
+from typing import cast
+
+from sqlalchemy import DDL, Date, ForeignKey, Integer, Table, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from product_fusion_backend.models.base import BaseModel
+from product_fusion_backend.models.member_model import MemberModel
+
+# Keeps member_daily_snapshot in step with every write to member, so rows of
+# past days follow later role and status changes and deletions. Members
+# without a creation time belong to no day and are not counted.
+MEMBER_DAILY_SNAPSHOT_FUNCTION = """
+CREATE OR REPLACE FUNCTION member_daily_snapshot_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.created_at IS NOT NULL THEN
+        UPDATE member_daily_snapshot SET count = count - 1
+        WHERE day = date(OLD.created_at) AND org_id = OLD.org_id AND role_id = OLD.role_id AND status = OLD.status;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.created_at IS NOT NULL THEN
+        INSERT INTO member_daily_snapshot (day, org_id, role_id, status, count)
+        VALUES (date(NEW.created_at), NEW.org_id, NEW.role_id, NEW.status, 1)
+        ON CONFLICT (day, org_id, role_id, status) DO UPDATE SET count = member_daily_snapshot.count + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Backfill and attach the trigger while writes to member are blocked, so no
+# row is counted twice or missed.
+MEMBER_DAILY_SNAPSHOT_BACKFILL = """
+INSERT INTO member_daily_snapshot (day, org_id, role_id, status, count)
+SELECT date(created_at), org_id, role_id, status, count(*) FROM member
+WHERE created_at IS NOT NULL
+GROUP BY date(created_at), org_id, role_id, status
+"""
+
+MEMBER_DAILY_SNAPSHOT_TRIGGER = """
+CREATE TRIGGER member_daily_snapshot_sync
+AFTER INSERT OR DELETE OR UPDATE OF org_id, role_id, status, created_at ON member
+FOR EACH ROW EXECUTE FUNCTION member_daily_snapshot_apply()
+"""
+
+
+class MemberDailySnapshotModel(BaseModel):
+    """Members created on ``day``, per organization and current role and status."""
+
+    __tablename__ = "member_daily_snapshot"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    org_id: Mapped[int] = mapped_column(ForeignKey("organization.id", ondelete="CASCADE"), primary_key=True)
+    role_id: Mapped[int] = mapped_column(ForeignKey("role.id", ondelete="CASCADE"), primary_key=True)
+    status: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+# Attached to member_daily_snapshot rather than member, so that
+# metadata.create_all on a database whose member table already exists still
+# backfills the snapshots and installs the trigger, like migration 9a4c6e1f2d58.
+cast(Table, MemberDailySnapshotModel.__table__).add_is_dependent_on(cast(Table, MemberModel.__table__))
+for statement in (
+    MEMBER_DAILY_SNAPSHOT_FUNCTION,
+    "LOCK TABLE member IN SHARE ROW EXCLUSIVE MODE",
+    MEMBER_DAILY_SNAPSHOT_BACKFILL,
+    "DROP TRIGGER IF EXISTS member_daily_snapshot_sync ON member",
+    MEMBER_DAILY_SNAPSHOT_TRIGGER,
+):
+    event.listen(MemberDailySnapshotModel.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
@@ -1,6 +1,6 @@
 from typing import Any
 
-from sqlalchemy import JSON, ForeignKey, Integer
+from sqlalchemy import JSON, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from product_fusion_backend.models.base import Base, BaseModel
@@ -8,6 +8,11 @@ from product_fusion_backend.models.base import Base, BaseModel
 
 class MemberModel(BaseModel, Base):
     __tablename__ = "member"  # type: ignore
+    __table_args__ = (
+        Index("ix_member_user_id_org_id", "user_id", "org_id", unique=True),
+        Index("ix_member_org_id_role_id", "org_id", "role_id"),
+        Index("ix_member_created_at", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     org_id: Mapped[int] = mapped_column(ForeignKey("organization.id", ondelete="CASCADE"), nullable=False)
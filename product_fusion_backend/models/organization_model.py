@@ -1,6 +1,6 @@
 from typing import Any
 
-from sqlalchemy import JSON, Boolean, Integer, String
+from sqlalchemy import JSON, Boolean, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from product_fusion_backend.models.base import Base, BaseModel
@@ -8,6 +8,7 @@ from product_fusion_backend.models.base import Base, BaseModel
 
 class OrganizationModel(BaseModel, Base):
     __tablename__ = "organization"  # type: ignore
+    __table_args__ = (Index("ix_organization_name", "name", unique=True),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from product_fusion_backend.models.base import Base, BaseModel
@@ -6,11 +6,14 @@ from product_fusion_backend.models.base import Base, BaseModel
 
 class RoleModel(BaseModel, Base):
     __tablename__ = "role"  # type: ignore
+    __table_args__ = (Index("ix_role_org_id_name", "org_id", "name", unique=True),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str] = mapped_column(String, nullable=True)
     org_id: Mapped[int] = mapped_column(ForeignKey("organization.id", ondelete="CASCADE"), nullable=False)
+    # Bitwise OR of core.utils.enums.Permission values.
+    permissions: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
 
     organization = relationship("OrganizationModel", back_populates="roles")
     members = relationship("MemberModel", back_populates="role")
@@ -5,39 +5,21 @@ from authlib.jose import jwt
 from fastapi import Request
 from starlette import status
 
-from product_fusion_backend.core import (
-    LOGIN_ALERT_MAIL_TEMPLATE,
-    PASSWORD_RESET_MAIL_TEMPLATE,
-    PASSWORD_UPDATE_MAIL_TEMPLATE,
-    VERIFY_EMAIL_TEMPLATE,
-    APIResponse,
-    StatusEnum,
-    redis_service,
-)
+from product_fusion_backend.core import APIResponse, HashPoolSaturatedError, StatusEnum, redis_service
 from product_fusion_backend.core.utils.hash_utils import hash_manager
-from product_fusion_backend.dao import MemberDAO, OrganizationDAO, RoleDAO, UserDAO
+from product_fusion_backend.core.utils.signed_token import signed_tokens
+from product_fusion_backend.dao import UserCredentials, UserDAO
 from product_fusion_backend.settings import settings
 from product_fusion_backend.web.api.auth.schema import LoginSchema, SignupSchema
 
-member_dao = MemberDAO()
 user_dao = UserDAO()
-org_dao = OrganizationDAO()
-role_dao = RoleDAO()
 
 
 class AuthController:
     @staticmethod
     async def signup(request: SignupSchema) -> APIResponse:
         try:
-            existing_user = await user_dao.get_by_email(request.email)  # type: ignore
-            if existing_user:
-                return APIResponse(
-                    status_=StatusEnum.ERROR,
-                    message="Email already registered",
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                )
-
-            hashed_password = hash_manager.hash_password(request.password)
+            hashed_password = await hash_manager.hash_password_async(request.password)
             verification_token = secrets.token_urlsafe(32)
             expires_at = datetime.now(UTC) + timedelta(hours=24)
             user_data = {
@@ -50,61 +32,40 @@ class AuthController:
                     },
                 },
             }
-            new_user = await user_dao.create(user_data)  # type: ignore
-
-            org = await org_dao.get_by_name(request.organization_name)  # type: ignore
-            if not org:
-                org = await org_dao.create(  # type: ignore
-                    {
-                        "name": request.organization_name,
-                        "status": request.organization_status,
-                        "personal": request.organization_personal,
-                        "settings": request.organization_settings,
-                    },
+            org_data = {
+                "name": request.organization_name,
+                "status": request.organization_status,
+                "personal": request.organization_personal,
+                "settings": request.organization_settings,
+            }
+            user_id = await user_dao.create_with_organization(user_data, org_data)  # type: ignore
+            if user_id is None:
+                return APIResponse(
+                    status_=StatusEnum.ERROR,
+                    message="Email already registered",
+                    status_code=status.HTTP_400_BAD_REQUEST,
                 )
 
-            owner_role = await role_dao.get_by_name_and_org("owner", org.id)  # type: ignore
-            if not owner_role:
-                owner_role = await role_dao.create(  # type: ignore
-                    {
-                        "name": "owner",
-                        "org_id": org.id,
-                        "description": "Owner of the organization",
-                    },
-                )
+            access_token = AuthController.create_access_token(user_id)
+            refresh_token = AuthController.create_refresh_token(user_id)
 
-            await member_dao.create(  # type: ignore
-                {
-                    "user_id": new_user.id,
-                    "org_id": org.id,
-                    "role_id": owner_role.id,
-                    "status": 1,
-                },
+            verification_link_token = signed_tokens.token_for(
+                user_id,
+                "email_verification",
+                verification_token,
+                expires_at,
             )
+            verification_link = f"http://0.0.0.0:8000/api/auth/verify-email?token={verification_link_token}"
 
-            access_token = AuthController.create_access_token(new_user.id)
-            refresh_token = AuthController.create_refresh_token(new_user.id)
-
-            await user_dao.update(new_user.id, {"settings": new_user.settings})  # type: ignore
-
-            verification_link = f"http://0.0.0.0:8000/api/auth/verify-email?token={verification_token}"
-
-            data =  {
-                    "email": request.email,
-                    "subject": "Welcome - Verify Your Email",
-                    "body": VERIFY_EMAIL_TEMPLATE.format(
-                        request.email,
-                        verification_link,
-                        verification_link,
-                    ),
-                }
-            await redis_service.insert(
+            await redis_service.queue_email(
                 request.email,
-                data,
-                queue=True,
+                "verify_email",
+                {
+                    "email": request.email,
+                    "verification_link": verification_link,
+                },
             )
 
-
             return APIResponse(
                 status_=StatusEnum.SUCCESS,
                 message="User registered successfully! Please verify your email to continue.",
@@ -116,6 +77,12 @@ class AuthController:
                 status_code=status.HTTP_201_CREATED,
             )
 
+        except HashPoolSaturatedError:
+            return APIResponse(
+                status_=StatusEnum.ERROR,
+                message="Server is busy, please try again shortly",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
         except Exception as exception:
             return APIResponse(
                 status_=StatusEnum.ERROR,
@@ -126,8 +93,8 @@ class AuthController:
     @staticmethod
     async def login(request: LoginSchema, metadata: Request) -> APIResponse:
         try:
-            user = await user_dao.get_by_email(request.email)  # type: ignore
-            if not user or not hash_manager.verify_password(request.password, user.password):
+            user = await user_dao.get_projection_by_email(request.email, UserCredentials)
+            if not user or not await hash_manager.verify_password_async(request.password, user.password):
                 return APIResponse(
                     status_=StatusEnum.ERROR,
                     message="Incorrect email or password",
@@ -139,19 +106,15 @@ class AuthController:
             ip_address = metadata.client.host or "Unknown"  # type: ignore
             user_agent = metadata.headers.get("User-Agent", "Unknown")
 
-            await redis_service.insert(
+            await redis_service.queue_email(
                 user.email,
-                data={
+                "login_alert",
+                {
                     "email": user.email,
-                    "subject": "New Login Detected",
-                    "body": LOGIN_ALERT_MAIL_TEMPLATE.format(
-                        user.email,
-                        datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S"),
-                        ip_address,
-                        user_agent,
-                    ),
+                    "login_time": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S"),
+                    "ip_address": ip_address,
+                    "device": user_agent,
                 },
-                queue=True,
             )
 
             return APIResponse(
@@ -164,6 +127,12 @@ class AuthController:
                 },
                 status_code=status.HTTP_200_OK,
             )
+        except HashPoolSaturatedError:
+            return APIResponse(
+                status_=StatusEnum.ERROR,
+                message="Server is busy, please try again shortly",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
         except Exception as exception:
             return APIResponse(
                 status_=StatusEnum.ERROR,
@@ -254,20 +223,15 @@ class AuthController:
         user.settings["reset_token"] = {"token": reset_token, "expires_at": expires_at.timestamp()}
         await user_dao.update(user.id, {"settings": user.settings})  # type: ignore
 
-        reset_link = f"http://0.0.0.0:8000/api/auth/reset-password?token={reset_token}"
+        reset_link_token = signed_tokens.token_for(user.id, "reset_token", reset_token, expires_at)
+        reset_link = f"http://0.0.0.0:8000/api/auth/reset-password?token={reset_link_token}"
 
-
-        await redis_service.insert(
+        await redis_service.queue_email(
             user.email,
-            {
-                "email": user.email,
-                "subject": "Password Reset Request",
-                "body": PASSWORD_RESET_MAIL_TEMPLATE.format(reset_link),
-            },
-            queue=True,
+            "password_reset",
+            {"reset_link": reset_link},
         )
 
-
         return APIResponse(
             status_=StatusEnum.SUCCESS,
             message="Password reset instructions sent to email",
@@ -285,29 +249,24 @@ class AuthController:
             )
 
         token_data = user.settings["reset_token"]
-        if token != token_data["token"] or datetime.now(UTC).timestamp() > token_data["expires_at"]:
+        if datetime.now(UTC).timestamp() > token_data["expires_at"]:
             return APIResponse(
                 status_=StatusEnum.ERROR,
                 message="Invalid or expired reset token",
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        hashed_password = hash_manager.hash_password(new_password)
+        try:
+            hashed_password = await hash_manager.hash_password_async(new_password)
+        except HashPoolSaturatedError:
+            return APIResponse(
+                status_=StatusEnum.ERROR,
+                message="Server is busy, please try again shortly",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
         user.password = hashed_password
         user.settings.pop("reset_token", None)
 
-
-
-        await redis_service.insert(
-            user.email,
-            {
-                "email": user.email,
-                "subject": "Password Updated",
-                "body": PASSWORD_UPDATE_MAIL_TEMPLATE.format(user.email),
-            },
-            queue=True,
-        )
-
         await user_dao.update(  # type: ignore
             user.id,
             {
@@ -316,6 +275,12 @@ class AuthController:
             },
         )
 
+        await redis_service.queue_email(
+            user.email,
+            "password_update",
+            {"email": user.email},
+        )
+
         return APIResponse(
             status_=StatusEnum.SUCCESS,
             message="Password reset successfully",
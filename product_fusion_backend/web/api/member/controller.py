@@ -1,57 +1,59 @@
 import secrets
 from datetime import UTC, datetime, timedelta
+from typing import Optional
 
 from fastapi.encoders import jsonable_encoder
 from starlette import status
 
-from product_fusion_backend.core import (
-    VERIFY_EMAIL_WITH_PASS_RESET_TEMPLATE,
-    APIResponse,
-    StatusEnum,
-    redis_service,
-)
-from product_fusion_backend.core.utils.hash_utils import hash_manager
-from product_fusion_backend.dao import MemberDAO, OrganizationDAO, RoleDAO, UserDAO
+from product_fusion_backend.core import APIResponse, Permission, StatusEnum, redis_service
+from product_fusion_backend.core.utils.hash_utils import HashPoolSaturatedError, hash_manager
+from product_fusion_backend.core.utils.signed_token import signed_tokens
+from product_fusion_backend.dao import MemberDAO, MemberRef, Principal, UserDAO, UserRef, role_allows
 from product_fusion_backend.web.api.member.schema import InviteMemberSchema
 
 
 class OrganizationMemberController:
     @staticmethod
-    async def invite_member(data: InviteMemberSchema, inviter_id: int) -> APIResponse:
-        inviter_member = await MemberDAO().get_by_user_and_org(inviter_id, data.organization_id)  # type: ignore
-        if not inviter_member or inviter_member.role.name not in ["admin", "owner"]:
+    async def invite_member(data: InviteMemberSchema, inviter: Optional[Principal]) -> APIResponse:
+        inviter_role_id = inviter.role_id(data.organization_id) if inviter else None
+        if not await role_allows(data.organization_id, inviter_role_id, Permission.INVITE_MEMBER):
             return APIResponse(
                 status_=StatusEnum.ERROR,
                 message="You don't have permission to invite members",
                 status_code=status.HTTP_403_FORBIDDEN,
             )
-        org = await OrganizationDAO().get(data.organization_id)  # type: ignore
-        if not org:
+        context = await MemberDAO().get_authorization_context(  # type: ignore
+            data.organization_id,
+            target_role_id=data.role_id,
+        )
+        if not context.organization_exists:
             return APIResponse(
                 status_=StatusEnum.ERROR,
                 message="Organization not found",
                 status_code=status.HTTP_404_NOT_FOUND,
             )
 
-        role = await RoleDAO().get(data.role_id)  # type: ignore
-        if not role or role.org_id != data.organization_id:
+        if context.target_role is None:
             return APIResponse(
                 status_=StatusEnum.ERROR,
                 message="Invalid role for the organization",
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        user = await UserDAO().get_by_email(data.email)  # type: ignore
-        if not user:
-            user = await UserDAO().create(  # type: ignore
+        user = await UserDAO().get_projection_by_email(data.email, UserRef)
+        if user:
+            user_id = user.id
+        else:
+            created_user = await UserDAO().create(  # type: ignore
                 {
                     "email": data.email,
                     "password": secrets.token_urlsafe(16),
                     "status": 0,
                 },
             )
+            user_id = created_user.id
 
-        existing_member = await MemberDAO().get_by_user_and_org(user.id, data.organization_id)  # type: ignore
+        existing_member = await MemberDAO().get_projection_by_user_and_org(user_id, data.organization_id, MemberRef)
         if existing_member:
             return APIResponse(
                 status_=StatusEnum.ERROR,
@@ -62,9 +64,9 @@ class OrganizationMemberController:
         invite_token = secrets.token_urlsafe(32)
         expires_at = datetime.now(UTC) + timedelta(days=7)
 
-        await MemberDAO().create(  # type: ignore
+        member = await MemberDAO().create(  # type: ignore
             {
-                "user_id": user.id,
+                "user_id": user_id,
                 "org_id": data.organization_id,
                 "role_id": data.role_id,
                 "status": 0,
@@ -72,14 +74,13 @@ class OrganizationMemberController:
             },
         )
 
-        invite_link = f"http://0.0.0.0:8000/api/org/member/accept-invite?token={invite_token}"
+        invite_link_token = signed_tokens.token_for(member.id, "invite_token", invite_token, expires_at)
+        invite_link = f"http://0.0.0.0:8000/api/org/member/accept-invite?token={invite_link_token}"
 
-        await redis_service.insert(
+        await redis_service.queue_email(
             data.email,
-            {
-                "subject": "Invitation to join organization",
-                "message": f"You've been invited to join an organization. Click here to accept: {invite_link}",
-            },
+            "invite_member",
+            {"invite_link": invite_link},
         )
 
         return APIResponse(
@@ -126,20 +127,35 @@ class OrganizationMemberController:
                 "expires_at": expires_at.timestamp(),
             }
             _password = user.password
+            try:
+                hashed_password = await hash_manager.hash_password_async(user.password)
+            except HashPoolSaturatedError:
+                return APIResponse(
+                    status_=StatusEnum.ERROR,
+                    message="Server is busy, please try again shortly",
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                )
             await UserDAO().update(  # type: ignore
                 user.id,
                 {
                     "settings": user.settings,  # type: ignore
-                    "password": hash_manager.hash_password(user.password),  # type: ignore
+                    "password": hashed_password,
                 },
             )
-            verification_link = f"http://0.0.0.0:8000/api/auth/verify-email?token={verification_token}"
+            verification_link_token = signed_tokens.token_for(
+                user.id,
+                "email_verification",
+                verification_token,
+                expires_at,
+            )
+            verification_link = f"http://0.0.0.0:8000/api/auth/verify-email?token={verification_link_token}"
 
-            await redis_service.insert(
+            await redis_service.queue_email(
                 user.email,
+                "verify_email_with_password_reset",
                 {
-                    "subject": "Verify Your Email and Set Password",
-                    "message": VERIFY_EMAIL_WITH_PASS_RESET_TEMPLATE.format(verification_link, _password),
+                    "verification_link": verification_link,
+                    "temporary_password": _password,
                 },
             )
 
@@ -156,31 +172,28 @@ class OrganizationMemberController:
             )
 
     @staticmethod
-    async def delete_member(member_id: int, org_id: int, deleter_id: int) -> APIResponse:
-        deleter_member = await MemberDAO().get_by_user_and_org(deleter_id, org_id)  # type: ignore
-        if not deleter_member or deleter_member.role.name not in ["admin", "owner"]:
+    async def delete_member(member_id: int, org_id: int, deleter: Optional[Principal]) -> APIResponse:
+        if not await role_allows(org_id, deleter.role_id(org_id) if deleter else None, Permission.REMOVE_MEMBER):
             return APIResponse(
                 status_=StatusEnum.ERROR,
                 message="You don't have permission to delete members",
                 status_code=403,
             )
+        context = await MemberDAO().get_authorization_context(org_id, target_member_id=member_id)  # type: ignore
 
-        member = await MemberDAO().get_user_with_role(member_id)  # type: ignore
-        if not member or member.org_id != org_id:
+        if context.target_member_role is None:
             return APIResponse(
                 status_=StatusEnum.ERROR,
                 message="Member not found in the organization",
                 status_code=404,
             )
 
-        if member.role.name == "owner":
-            owners_count = await MemberDAO().count_by_role_in_org("owner", org_id)  # type: ignore
-            if owners_count <= 1:
-                return APIResponse(
-                    status_=StatusEnum.ERROR,
-                    message="Cannot delete the last owner",
-                    status_code=403,
-                )
+        if context.target_member_role == "owner" and context.owner_count <= 1:
+            return APIResponse(
+                status_=StatusEnum.ERROR,
+                message="Cannot delete the last owner",
+                status_code=403,
+            )
 
         await MemberDAO().delete(member_id)  # type: ignore
 
@@ -191,25 +204,32 @@ class OrganizationMemberController:
         )
 
     @staticmethod
-    async def update_member_role(member_id: int, org_id: int, new_role_id: int, updater_id: int) -> APIResponse:
-        updater_member = await MemberDAO().get_by_user_and_org(updater_id, org_id)  # type: ignore
-        if not updater_member or updater_member.role.name not in ["admin", "owner"]:
+    async def update_member_role(
+        member_id: int,
+        org_id: int,
+        new_role_id: int,
+        updater: Optional[Principal],
+    ) -> APIResponse:
+        if not await role_allows(org_id, updater.role_id(org_id) if updater else None, Permission.UPDATE_MEMBER_ROLE):
             return APIResponse(
                 status_=StatusEnum.ERROR,
                 message="You don't have permission to update member roles",
                 status_code=403,
             )
+        context = await MemberDAO().get_authorization_context(  # type: ignore
+            org_id,
+            target_member_id=member_id,
+            target_role_id=new_role_id,
+        )
 
-        member = await MemberDAO().get_user_with_role(member_id)  # type: ignore
-        if not member or member.org_id != org_id:
+        if context.target_member_role is None:
             return APIResponse(
                 status_=StatusEnum.ERROR,
                 message="Member not found in the organization. Please invite the user first",
                 status_code=404,
             )
 
-        new_role = await RoleDAO().get(new_role_id)  # type: ignore
-        if not new_role or new_role.org_id != org_id:
+        if context.target_role is None:
             return APIResponse(
                 status_=StatusEnum.ERROR,
                 message="Invalid role for the organization",
@@ -217,9 +237,8 @@ class OrganizationMemberController:
             )
 
         # Prevent changing the role of the last owner
-        if member.role.name == "owner":
-            owners_count = await MemberDAO().count_by_role_in_org("owner", org_id)  # type: ignore
-            if owners_count <= 1 and new_role.name != "owner":
+        if context.target_member_role == "owner":
+            if context.owner_count <= 1 and context.target_role != "owner":
                 return APIResponse(
                     status_=StatusEnum.ERROR,
                     message="Cannot change the role of the last owner",
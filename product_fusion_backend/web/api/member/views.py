@@ -1,16 +1,22 @@
-from fastapi import APIRouter, Query, Request
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
 
 from product_fusion_backend.core import APIResponse
+from product_fusion_backend.dao import Principal
 from product_fusion_backend.web.api.member.controller import OrganizationMemberController
 from product_fusion_backend.web.api.member.schema import DeleteMemberSchema, InviteMemberSchema, UpdateMemberRoleSchema
+from product_fusion_backend.web.api.principal import get_principal
 
 org_member_router = APIRouter(prefix="/org/member", tags=["Organization"])
 
 
 @org_member_router.post("/invite")
-async def invite_member(request: Request, data: InviteMemberSchema) -> APIResponse:
-    inviter_id = request.state.user_id
-    return await OrganizationMemberController.invite_member(data, inviter_id)
+async def invite_member(
+    data: InviteMemberSchema,
+    inviter: Optional[Principal] = Depends(get_principal),
+) -> APIResponse:
+    return await OrganizationMemberController.invite_member(data, inviter)
 
 
 @org_member_router.get("/accept-invite")
@@ -21,25 +27,23 @@ async def accept_invite(token: str = Query(...)) -> APIResponse:
 @org_member_router.delete("/delete")
 async def delete_member(
     body: DeleteMemberSchema,
-    request: Request,
+    deleter: Optional[Principal] = Depends(get_principal),
 ) -> APIResponse:
-    deleter_id = request.state.user_id
     return await OrganizationMemberController.delete_member(
         body.member_id,
         body.organization_id,
-        deleter_id,
+        deleter,
     )
 
 
 @org_member_router.put("/update-role")
 async def update_member_role(
     body: UpdateMemberRoleSchema,
-    request: Request,
+    updater: Optional[Principal] = Depends(get_principal),
 ) -> APIResponse:
-    updater_id = request.state.user_id
     return await OrganizationMemberController.update_member_role(
         body.member_id,
         body.organization_id,
         body.new_role_id,
-        updater_id,
+        updater,
     )
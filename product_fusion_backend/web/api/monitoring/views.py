@@ -1,6 +1,16 @@
 from fastapi import APIRouter
 
-from product_fusion_backend.core import DEFAULT_ROUTE_OPTIONS, CommonResponseSchema, StatusEnum
+from product_fusion_backend.connections import database
+from product_fusion_backend.core import (
+    DEFAULT_ROUTE_OPTIONS,
+    CommonResponseSchema,
+    StatusEnum,
+    dao_cache,
+    email_service,
+    stats_cache,
+)
+from product_fusion_backend.core.utils.hash_utils import hash_manager
+from product_fusion_backend.core.utils.token_cache import token_cache
 
 health_router = APIRouter(tags=["Monitoring", "Health"])
 
@@ -10,9 +20,40 @@ def health_check() -> CommonResponseSchema:
     """
     Checks the health of a project.
 
-    It returns 200 if the project is healthy.
+    It returns 200 if the project is healthy, along with the database pool
+    occupancy so pool exhaustion shows up in health probes.
     """
+    pool = database.pool_stats()
     return CommonResponseSchema(
         status=StatusEnum.SUCCESS,
         message="The project is healthy.",
+        data={
+            "database_pool": {
+                "checked_out": pool["checked_out"],
+                "overflow": pool["overflow"],
+                "timeouts": pool["timeouts"],
+            },
+        },
+    )
+
+
+@health_router.get("/metrics", **DEFAULT_ROUTE_OPTIONS)
+def metrics() -> CommonResponseSchema:
+    """
+    Exposes runtime metrics of the worker serving the request.
+
+    :returns: current pool statistics.
+    """
+    return CommonResponseSchema(
+        status=StatusEnum.SUCCESS,
+        message="Metrics retrieved successfully.",
+        data={
+            "database_pool": database.pool_stats(),
+            "database_replicas": database.replica_stats(),
+            "dao_cache": dao_cache.stats(),
+            "stats_cache": stats_cache.stats(),
+            "hash_pool": hash_manager.stats(),
+            "token_cache": token_cache.stats(),
+            "smtp_pool": email_service.stats(),
+        },
     )
@@ -0,0 +1,20 @@
+from typing import Optional
+
+from fastapi import Request
+
+from product_fusion_backend.dao import Principal, UserDAO
+
+
+async def get_principal(request: Request) -> Optional[Principal]:
+    """
+    Resolve the authenticated user and their memberships once per request.
+
+    The first call loads them, through the shared principal cache, and keeps
+    the result on ``request.state`` for every later dependency and controller.
+
+    :param request: request authenticated by ``JWTAuthMiddleware``.
+    :return: the caller, ``None`` if their user no longer exists.
+    """
+    if not hasattr(request.state, "principal"):
+        request.state.principal = await UserDAO().get_principal(int(request.state.user_id))  # type: ignore
+    return request.state.principal
@@ -1,29 +1,50 @@
-from datetime import datetime
-from typing import Optional
+from datetime import UTC, datetime
+from typing import Any, Awaitable, Callable, Optional
 
-from product_fusion_backend.core import APIResponse, StatusEnum
+from product_fusion_backend.core import APIResponse, StatusEnum, stats_cache
+from product_fusion_backend.core.cache import CachedResult
 from product_fusion_backend.dao import OrganizationDAO, RoleDAO
 
 
 class StatsController:
+    @staticmethod
+    async def _cached(key: str, query: Callable[[], Awaitable[Any]]) -> CachedResult:
+        return await stats_cache.get_or_compute(key, query)
+
+    @staticmethod
+    def _normalize_date(value: Optional[datetime]) -> str:
+        if value is None:
+            return ""
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC).replace(tzinfo=None)
+        return value.isoformat()
+
     @staticmethod
     async def get_role_wise_user_count() -> APIResponse:
-        stats = await RoleDAO().get_role_wise_user_count()  # type: ignore
+        result = await StatsController._cached(
+            "role-wise-users",
+            RoleDAO().get_role_wise_user_count,  # type: ignore
+        )
         return APIResponse(
             status_=StatusEnum.SUCCESS,
             message="Role-wise user count retrieved successfully",
-            data=stats,
+            data=result.value,
             status_code=200,
+            headers=result.headers(),
         )
 
     @staticmethod
     async def get_organization_wise_member_count() -> APIResponse:
-        stats = await OrganizationDAO().get_organization_wise_member_count()  # type: ignore
+        result = await StatsController._cached(
+            "organization-wise-members",
+            OrganizationDAO().get_organization_wise_member_count,  # type: ignore
+        )
         return APIResponse(
             status_=StatusEnum.SUCCESS,
             message="Organization-wise member count retrieved successfully",
-            data=stats,
+            data=result.value,
             status_code=200,
+            headers=result.headers(),
         )
 
     @staticmethod
@@ -32,14 +53,26 @@ class StatsController:
         to_date: Optional[datetime] = None,
         status: Optional[int] = None,
     ) -> APIResponse:
-        stats = await OrganizationDAO().get_organization_role_wise_user_count(  # type: ignore
-            from_date,
-            to_date,
-            status,
+        key = ":".join(
+            [
+                "organization-role-wise-users",
+                StatsController._normalize_date(from_date),
+                StatsController._normalize_date(to_date),
+                "" if status is None else str(status),
+            ],
+        )
+        result = await StatsController._cached(
+            key,
+            lambda: OrganizationDAO().get_organization_role_wise_user_count(  # type: ignore
+                from_date,
+                to_date,
+                status,
+            ),
         )
         return APIResponse(
             status_=StatusEnum.SUCCESS,
             message="Organization and role-wise user count retrieved successfully",
-            data=stats,
+            data=result.value,
             status_code=200,
+            headers=result.headers(),
         )
@@ -7,7 +7,7 @@ from fastapi.staticfiles import StaticFiles
 from starlette.middleware.cors import CORSMiddleware
 
 from product_fusion_backend.core import DEFAULT_ROUTE_OPTIONS, CommonResponseSchema, StatusEnum, configure_logging
-from product_fusion_backend.middlewares import JWTAuthMiddleware, LoggingMiddleware
+from product_fusion_backend.middlewares import JWTAuthMiddleware, LoggingMiddleware, UnitOfWorkMiddleware
 from product_fusion_backend.web.api.router import api_router
 from product_fusion_backend.web.lifetime import lifespan
 
@@ -32,6 +32,7 @@ def get_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    app.add_middleware(UnitOfWorkMiddleware)  # type: ignore
     app.add_middleware(
         CORSMiddleware,  # type: ignore
         allow_origins=["*"],
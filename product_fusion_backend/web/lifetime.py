@@ -5,8 +5,11 @@ from typing import AsyncIterator
 from fastapi import FastAPI
 
 from product_fusion_backend.connections import database
-from product_fusion_backend.core import OpenTelemetry, redis_service
+from product_fusion_backend.core import OpenTelemetry, dao_cache, email_service, permission_table, redis_service
+from product_fusion_backend.core.utils.hash_utils import hash_manager
+from product_fusion_backend.dao import RoleDAO
 from product_fusion_backend.models.base import BaseModel
+from product_fusion_backend.settings import settings
 
 
 @asynccontextmanager
@@ -14,9 +17,19 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app.middleware_stack = None
     OpenTelemetry.setup_opentelemetry(app)
     app.middleware_stack = app.build_middleware_stack()
-    await redis_service.start_subscriber("email-channel")
+    await redis_service.startup()
+    await dao_cache.start_listener()
+    if settings.email_consumer_in_api:
+        await redis_service.start_subscriber()
     async with database.engine.begin() as conn:
         await conn.run_sync(BaseModel.metadata.create_all)
+    await permission_table.start(RoleDAO().get_permission_masks)
     yield
+    await permission_table.stop()
     await redis_service.stop_subscriber()
+    await dao_cache.stop_listener()
+    await redis_service.shutdown()
+    await email_service.close()
+    hash_manager.shutdown()
+    await database.dispose()
     OpenTelemetry.stop_opentelemetry(app)
@@ -0,0 +1,52 @@
+import asyncio
+import signal
+
+from loguru import logger
+
+from product_fusion_backend.core import configure_logging, email_service, redis_service
+from product_fusion_backend.settings import settings
+
+
+class EmailWorker:
+    """
+    Standalone email worker.
+
+    Runs only the email stream consumers, so email delivery can be scaled
+    independently from the API workers.
+    """
+
+    def __init__(self, concurrency: int = settings.email_worker_concurrency) -> None:
+        self.concurrency = concurrency
+
+    async def serve(self) -> None:
+        """
+        Consume the email stream until SIGINT or SIGTERM is received.
+        """
+        configure_logging()
+        await redis_service.startup()
+
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop_event.set)
+
+        consumer_name = redis_service.consumer_name()
+        consumers = [
+            asyncio.create_task(redis_service.consume(f"{consumer_name}-{index}")) for index in range(self.concurrency)
+        ]
+        logger.info(f"Email worker started with {self.concurrency} consumer(s).")
+
+        await stop_event.wait()
+        logger.info("Stopping email worker...")
+        for consumer in consumers:
+            consumer.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+
+        await redis_service.shutdown()
+        await email_service.close()
+
+    def run(self) -> None:
+        """
+        Run the email worker.
+        """
+        asyncio.run(self.serve())
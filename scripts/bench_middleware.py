@@ -0,0 +1,146 @@
+"""
+Per-request overhead of the middleware stack, before and after the pure ASGI rewrite.
+
+Both stacks serve the same API router in process through httpx's
+ASGITransport, so no network or server is involved:
+
+- ``base_http``: the JWT and logging middlewares as they were written on
+  Starlette's ``BaseHTTPMiddleware`` before the rewrite.
+- ``asgi``: the current pure ASGI ``JWTAuthMiddleware`` and ``LoggingMiddleware``.
+
+``/api/health`` skips authentication; ``/api/echo`` is authenticated with a
+bearer token. The echo router is not part of ``api_router``, so it is mounted
+here. Neither route touches the database or Redis.
+
+Usage::
+
+    SECRET_KEY=x SMTP_USERNAME=x SMTP_PASSWORD=x LOG_LEVEL=ERROR \\
+        PYTHONPATH=. python scripts/bench_middleware.py --requests 3000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable
+
+import httpx
+from authlib.jose import JoseError, jwt
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from product_fusion_backend.core import (
+    SKIP_URLS,
+    APIResponse,
+    StatusEnum,
+    configure_logging,
+    end_stage_logger,
+    stage_logger,
+)
+from product_fusion_backend.middlewares import JWTAuthMiddleware, LoggingMiddleware
+from product_fusion_backend.settings import settings
+from product_fusion_backend.web.api.echo.views import echo_router
+from product_fusion_backend.web.api.router import api_router
+
+
+class BaseHTTPJWTAuthMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        if request.url.path in SKIP_URLS:
+            return await call_next(request)
+
+        auth_header = request.headers.get("Authorization")
+        if not auth_header:
+            return APIResponse(status_code=401, message="Authorization header is required", status_=StatusEnum.ERROR)
+
+        try:
+            scheme, token = auth_header.split()
+            if scheme.lower() != "bearer":
+                return APIResponse(status_code=401, message="Invalid token type", status_=StatusEnum.ERROR)
+            payload = jwt.decode(token, settings.secret_key)
+            request.state.user_id = payload.get("sub")
+        except (ValueError, JoseError):
+            return APIResponse(status_code=401, message="Invalid token", status_=StatusEnum.ERROR)
+
+        return await call_next(request)
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        request_line = ""
+        if request.client:
+            request_line = (
+                f'{request.client.host}:{request.client.port} - "{request.method} {request.url.path} '
+                f'{request.scope["http_version"]}"'
+            )
+            stage_logger.info(request_line)
+        response = await call_next(request)
+        if request.client:
+            end_stage_logger.info(f"{request_line} {response.status_code}")
+        return response
+
+
+STACKS: dict[str, tuple[Any, Any]] = {
+    "base_http": (BaseHTTPLoggingMiddleware, BaseHTTPJWTAuthMiddleware),
+    "asgi": (LoggingMiddleware, JWTAuthMiddleware),
+}
+
+
+def build_app(stack: str) -> FastAPI:
+    """
+    Build an application serving the API router behind one middleware stack.
+
+    :param stack: key of ``STACKS``.
+    :return: application without lifespan, so nothing connects on startup.
+    """
+    logging_middleware, auth_middleware = STACKS[stack]
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(logging_middleware)
+    app.add_middleware(auth_middleware)
+    app.include_router(router=api_router, prefix="/api")
+    app.include_router(router=echo_router, prefix="/api")
+    return app
+
+
+async def measure(app: FastAPI, method: str, path: str, requests: int, **kwargs: Any) -> list[float]:
+    """
+    Time ``requests`` sequential requests after a short warm-up.
+
+    :return: latency of each request, in milliseconds.
+    """
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 50000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(requests, 200)):
+            await client.request(method, path, **kwargs)
+
+        timings = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            timings.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise RuntimeError(f"{method} {path} returned {response.status_code}")
+    return timings
+
+
+async def main(requests: int) -> None:
+    configure_logging()
+    token = jwt.encode({"alg": settings.jwt_algorithm}, {"sub": "1"}, settings.secret_key).decode()
+    routes = [
+        ("GET", "/api/health", {}),
+        ("POST", "/api/echo", {"json": {"message": "ping"}, "headers": {"Authorization": f"Bearer {token}"}}),
+    ]
+
+    print(f"{'stack':<10} {'route':<12} {'mean ms':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for method, path, kwargs in routes:
+        for stack in STACKS:
+            timings = await measure(build_app(stack), method, path, requests, **kwargs)
+            mean, p50 = statistics.mean(timings), statistics.median(timings)
+            p99 = statistics.quantiles(timings, n=100)[98]
+            print(f"{stack:<10} {path:<12} {mean:>8.3f} {p50:>8.3f} {p99:>8.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=3000, help="timed requests per stack and route")
+    asyncio.run(main(parser.parse_args().requests))
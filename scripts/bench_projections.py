@@ -0,0 +1,87 @@
+"""
+Latency and allocations of reading 10k users as projections versus full ORM entities.
+
+- ``entities``: ``UserDAO.get_all()``, one ``UserModel`` per row with identity
+  map bookkeeping.
+- ``UserRef`` and ``UserCredentials``: ``UserDAO.get_projections()``, one
+  named tuple per row with only the projected columns.
+
+The user table is topped up to ``--rows`` rows and every variant reads all of
+it, each read in a fresh unit of work so no identity map is reused. Latency is
+the median of ``--repeat`` reads; allocation is the tracemalloc peak of one
+extra read. Works on SQLite or Postgres; use a scratch database::
+
+    SECRET_KEY=x SMTP_USERNAME=x SMTP_PASSWORD=x LOG_LEVEL=ERROR CACHE_ENABLED=False \\
+        DATABASE_URL=sqlite+aiosqlite:////tmp/bench.db PYTHONPATH=. python scripts/bench_projections.py
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+import uuid
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import func, insert, select
+
+from product_fusion_backend.connections import database
+from product_fusion_backend.dao import UserCredentials, UserDAO, UserRef
+from product_fusion_backend.models.base import BaseModel
+from product_fusion_backend.models.user_model import UserModel
+
+user_dao = UserDAO()
+
+READS: dict[str, Callable[[], Awaitable[Any]]] = {
+    "entities": user_dao.get_all,  # type: ignore
+    "UserRef": lambda: user_dao.get_projections(UserRef),  # type: ignore
+    "UserCredentials": lambda: user_dao.get_projections(UserCredentials),  # type: ignore
+}
+
+
+async def seed(rows: int) -> None:
+    async with database.engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.create_all)
+        missing = rows - (await conn.scalar(select(func.count()).select_from(UserModel)) or 0)
+        if missing > 0:
+            await conn.execute(
+                insert(UserModel),
+                [
+                    {"email": f"{uuid.uuid4().hex[:16]}@bench.example", "password": "x" * 60, "profile": {}}
+                    for _ in range(missing)
+                ],
+            )
+
+
+async def read(name: str) -> int:
+    async with database.unit_of_work():
+        return len(await READS[name]())
+
+
+async def main(rows: int, repeat: int) -> None:
+    await seed(rows)
+
+    print(f"{'read':<16} {'rows':>6} {'p50 ms':>8} {'peak MiB':>9}")
+    for name in READS:
+        await read(name)
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            count = await read(name)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        tracemalloc.start()
+        await read(name)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:<16} {count:>6} {statistics.median(timings):>8.1f} {peak / 2**20:>9.1f}")
+
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000, help="users in the table")
+    parser.add_argument("--repeat", type=int, default=10, help="timed reads per variant")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,46 @@
+import asyncio
+import os
+from typing import Iterator
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import pool, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+# Tests that need a database run against TEST_DATABASE_URL, which must point at
+# a dedicated Postgres database: its public schema is dropped and rebuilt from
+# the migrations. The application reads the same URL, so it is exported before
+# anything imports the settings.
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+requires_postgres = pytest.mark.skipif(
+    not TEST_DATABASE_URL or make_url(TEST_DATABASE_URL).get_backend_name() != "postgresql",
+    reason="TEST_DATABASE_URL is not set to a Postgres database",
+)
+
+
+async def _reset_schema(url: str) -> None:
+    engine = create_async_engine(url, poolclass=pool.NullPool)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+    await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def migrated_database() -> Iterator[str]:
+    """
+    Rebuild the test database from the Alembic migrations.
+
+    :yields: URL of the migrated database.
+    """
+    asyncio.run(_reset_schema(TEST_DATABASE_URL))
+    # Built without alembic.ini, which has no logging sections for env.py.
+    config = Config()
+    config.set_main_option("script_location", "product_fusion_backend/migrations")
+    command.upgrade(config, "head")
+    yield TEST_DATABASE_URL
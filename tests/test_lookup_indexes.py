@@ -0,0 +1,57 @@
+import asyncio
+import json
+from typing import Any
+
+import pytest
+from sqlalchemy import Select, and_, func, pool, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+from tests.conftest import requires_postgres
+
+from product_fusion_backend.models import MemberModel, OrganizationModel, RoleModel
+
+# The lookups of the hot paths, written the way the DAOs issue them, and the
+# index of migration 3f9c1a7e2b84 each one must be served by.
+LOOKUPS: dict[str, Select[Any]] = {
+    "ix_member_user_id_org_id": select(MemberModel).where(
+        and_(MemberModel.user_id == 1, MemberModel.org_id == 1),
+    ),
+    "ix_member_org_id_role_id": select(func.count())
+    .select_from(MemberModel)
+    .where((MemberModel.org_id == 1) & (MemberModel.role.has(name="owner"))),
+    "ix_member_created_at": select(MemberModel).where(MemberModel.created_at >= func.localtimestamp()),
+    "ix_role_org_id_name": select(RoleModel).where(RoleModel.name == "owner", RoleModel.org_id == 1),
+    "ix_organization_name": select(OrganizationModel).where(OrganizationModel.name == "acme"),
+}
+
+
+def _index_names(plan: Any) -> set[str]:
+    if isinstance(plan, list):
+        return set().union(*(_index_names(item) for item in plan))
+    if not isinstance(plan, dict):
+        return set()
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    return names.union(*(_index_names(value) for value in plan.values()))
+
+
+async def _explain(url: str, statement: Select[Any]) -> Any:
+    sql = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    engine = create_async_engine(url, poolclass=pool.NullPool)
+    try:
+        async with engine.begin() as conn:
+            # The test tables are empty, where a sequential scan is always
+            # cheapest; disabling it makes the planner show the index it
+            # would pick for a populated table.
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+            result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+            plan = result.scalar_one()
+            return json.loads(plan) if isinstance(plan, str) else plan
+    finally:
+        await engine.dispose()
+
+
+@requires_postgres
+@pytest.mark.parametrize("index_name", LOOKUPS)
+def test_lookup_uses_index(migrated_database: str, index_name: str) -> None:
+    plan = asyncio.run(_explain(migrated_database, LOOKUPS[index_name]))
+    assert index_name in _index_names(plan), plan
@@ -0,0 +1,100 @@
+import asyncio
+import uuid
+from typing import Any, Optional
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from tests.conftest import requires_postgres
+
+from product_fusion_backend.connections import database
+from product_fusion_backend.core.utils.enums import ROLE_PERMISSIONS
+from product_fusion_backend.dao import UserDAO
+
+TABLES = ("user", "organization", "role", "member")
+
+
+def _signup_data(**overrides: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+    suffix = uuid.uuid4().hex[:12]
+    user_in: dict[str, Any] = {"email": f"{suffix}@example.com", "password": "hashed", "settings": {}}
+    org_in: dict[str, Any] = {"name": f"org-{suffix}", "status": 0, "personal": False, "settings": None}
+    for key, value in overrides.items():
+        target, column = key.split("__")
+        (user_in if target == "user" else org_in)[column] = value
+    return user_in, org_in
+
+
+async def _signup(user_in: dict[str, Any], org_in: dict[str, Any]) -> Optional[int]:
+    try:
+        async with database.unit_of_work():
+            return await UserDAO().create_with_organization(user_in, org_in)  # type: ignore
+    finally:
+        await database.dispose()
+
+
+async def _fetch(sql: str, **params: Any) -> list[Any]:
+    try:
+        async with database.engine.connect() as conn:
+            return list((await conn.execute(text(sql), params)).all())
+    finally:
+        await database.dispose()
+
+
+def _counts() -> dict[str, int]:
+    rows = asyncio.run(_fetch(" UNION ALL ".join(f"SELECT '{table}', count(*) FROM \"{table}\"" for table in TABLES)))
+    return dict(rows)
+
+
+@requires_postgres
+def test_signup_creates_user_organization_role_and_member(migrated_database: str) -> None:
+    user_in, org_in = _signup_data()
+
+    user_id = asyncio.run(_signup(user_in, org_in))
+
+    assert user_id is not None
+    rows = asyncio.run(
+        _fetch(
+            """
+            SELECT u.email, o.name, r.name, r.permissions, m.status
+            FROM member m
+            JOIN "user" u ON u.id = m.user_id
+            JOIN organization o ON o.id = m.org_id
+            JOIN role r ON r.id = m.role_id AND r.org_id = o.id
+            WHERE m.user_id = :user_id
+            """,
+            user_id=user_id,
+        ),
+    )
+    assert rows == [(user_in["email"], org_in["name"], "owner", int(ROLE_PERMISSIONS["owner"]), 1)]
+
+
+@requires_postgres
+def test_signup_with_taken_email_creates_nothing(migrated_database: str) -> None:
+    user_in, org_in = _signup_data()
+    asyncio.run(_signup(user_in, org_in))
+    before = _counts()
+
+    _, other_org_in = _signup_data()
+    assert asyncio.run(_signup(user_in, other_org_in)) is None
+
+    assert _counts() == before
+
+
+@requires_postgres
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"user__email": "x" * 60 + "@example.com"},
+        {"org__name": "x" * 60},
+        {"org__status": None},
+    ],
+    ids=["user insert fails", "organization insert fails", "organization not null fails"],
+)
+def test_failed_signup_creates_nothing(migrated_database: str, overrides: dict[str, Any]) -> None:
+    user_in, org_in = _signup_data(**overrides)
+    before = _counts()
+
+    with pytest.raises(DBAPIError):
+        asyncio.run(_signup(user_in, org_in))
+
+    assert _counts() == before